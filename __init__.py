@@ -1,12 +1,14 @@
-def classFactory(iface):
-    # Check and install dependencies
-    try:
-        import requests
-        import reportlab
-    except ImportError:
-        from .dependency_installer import install_dependencies
-        install_dependencies()
-    
-    from .charge_spot import ChargeSpot
-    return ChargeSpot(iface)
-
+# Process-wide API client so the pooled HTTP session survives plugin reloads
+_api_client = None
+
+
+def classFactory(iface):
+    # Dependencies are checked and installed lazily at their point of use
+    # (first search / first PDF export) so plugin load stays fast
+    global _api_client
+    if _api_client is None:
+        from .api_client import OpenChargeMapAPI
+        _api_client = OpenChargeMapAPI()
+
+    from .charge_spot import ChargeSpot
+    return ChargeSpot(iface, api_client=_api_client)
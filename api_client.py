@@ -5,54 +5,324 @@ OpenChargeMap API Client for ChargeSpot QGIS Plugin
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+import hashlib
 import json
-from typing import List, Dict, Optional, Tuple
-from qgis.PyQt.QtCore import QObject, pyqtSignal, QThread
-from qgis.core import QgsMessageLog, Qgis
+import os
+import random
+import threading
+import time
 
+try:
+    import orjson
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from typing import Iterable, List, Dict, Optional, Tuple
+from qgis.PyQt.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
+from qgis.core import QgsApplication, QgsMessageLog, Qgis
+
+# Verbose per-request logging; formatting and Qt dispatch are not free,
+# so the chatty Info-level messages are opt-in
+_DEBUG = os.environ.get('CHARGESPOT_DEBUG') == '1'
+
+# Shared fallback for absent nested dicts in the extraction hot path
+_EMPTY = {}
+
+# Transport-level errors we translate into user-facing messages
+_HTTP_ERRORS = ()
+if REQUESTS_AVAILABLE:
+    _HTTP_ERRORS += (requests.exceptions.RequestException,)
+if HTTPX_AVAILABLE:
+    _HTTP_ERRORS += (httpx.HTTPError,)
+
+# AddressInfo keys joined (in order) into the display address
+_ADDRESS_KEYS = ('AddressLine1', 'Town', 'StateOrProvince', 'Postcode')
+
+# C-level bulk getter for the flat station fields; full API responses
+# carry all of these keys (possibly null), so the KeyError fallback in
+# _extract_station is rare
+_BASIC_GETTER = itemgetter(
+    'ID', 'URL', 'NumberOfPoints', 'GeneralComments',
+    'DateCreated', 'DateLastVerified', 'UsageCost'
+)
+
+
+class _RateLimiter:
+    """Token-bucket limiter for outbound API calls.
+
+    Keeps burst traffic (multi-point scans, rapid repeat searches) under
+    the server's rate limit instead of bursting into 429 responses and
+    their multi-second block windows.
+    """
+
+    def __init__(self, rate=2.0, burst=4):
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.last_refill) * self.rate
+                )
+                self.last_refill = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            # Small jitter so concurrent workers do not wake in lockstep
+            time.sleep(wait + random.uniform(0, 0.05))
+
+
+# Module-level limiter shared by all workers hitting the API
+_RATE_LIMITER = _RateLimiter()
+
+# Module-level session so the keep-alive connection pool survives plugin
+# reloads and is shared by every OpenChargeMapAPI instance
+_SESSION = None
+
+
+def ensure_transport():
+    """Check that an HTTP transport exists, offering to install requests.
+
+    Must run on the GUI thread — install_dependencies opens Qt dialogs.
+    Callers dispatch a search worker only when this returns True; the
+    worker side (_ensure_requests) never prompts.
+    """
+    if HTTPX_AVAILABLE or REQUESTS_AVAILABLE:
+        return True
+    from .dependency_installer import install_dependencies
+    return install_dependencies(['requests'])
+
+
+def _ensure_requests():
+    """Bind the requests names once the package is importable.
+
+    Runs on worker threads, so it must never prompt; ensure_transport
+    handles the interactive install on the GUI thread before a search
+    is dispatched. Raises ImportError when requests is still missing.
+    """
+    global requests, HTTPAdapter, Retry, REQUESTS_AVAILABLE, _HTTP_ERRORS
+    if REQUESTS_AVAILABLE:
+        return
+
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError:
+        raise ImportError("Requests library is not available. Please install it: pip install requests")
+    REQUESTS_AVAILABLE = True
+    _HTTP_ERRORS += (requests.exceptions.RequestException,)
+
+
+def _build_httpx_client():
+    """Build an HTTP/2 client so concurrent searches multiplex one connection."""
+    try:
+        return httpx.Client(
+            http2=True,
+            headers={
+                'User-Agent': 'ChargeSpot-QGIS-Plugin/1.0 (Educational Use)',
+                'Accept-Encoding': 'gzip, deflate'
+            },
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=30.0
+        )
+    except ImportError:
+        # httpx is installed without the optional h2 extra
+        return None
+
+
+# Status codes the requests adapter retries; the httpx path mirrors them
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+def _httpx_get_with_retries(session, url, params, headers, retries=3, backoff_factor=0.5):
+    """GET via httpx with the retry policy the requests adapter mounts.
+
+    httpx.Client has no status-code retries (the transport's retries=
+    only covers connect errors), so the 429/5xx handling is replicated
+    here: exponential backoff, honouring Retry-After when the server
+    sends one.
+    """
+    for attempt in range(retries):
+        response = session.get(url, params=params, headers=headers)
+        if response.status_code not in _RETRY_STATUSES:
+            return response
+        retry_after = response.headers.get('Retry-After')
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = backoff_factor * (2 ** attempt)
+        time.sleep(delay)
+    return session.get(url, params=params, headers=headers)
+
+
+def _get_session():
+    """Lazily build the shared HTTP client once per process.
+
+    Prefers an HTTP/2 httpx.Client (parallel searches share one TCP+TLS
+    connection); falls back to a pooled keep-alive requests.Session.
+    """
+    global _SESSION
+    if _SESSION is None and HTTPX_AVAILABLE:
+        _SESSION = _build_httpx_client()
+    if _SESSION is None:
+        _ensure_requests()
+        session = requests.Session()
+        # Reuse pooled keep-alive connections so repeated searches skip the
+        # TCP+TLS handshake, and retry transient server/rate-limit errors
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                respect_retry_after_header=True
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'User-Agent': 'ChargeSpot-QGIS-Plugin/1.0 (Educational Use)',
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        _SESSION = session
+    return _SESSION
+
+
+class APIWorkerSignals(QObject):
+    """Signal holder for pooled workers (QRunnable cannot emit signals)."""
 
-class APIWorker(QThread):
-    """Worker thread for API calls to prevent UI blocking."""
-    
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
-    
+
+
+class APIWorker(QRunnable):
+    """Pooled worker for API calls to prevent UI blocking.
+
+    Runs on QThreadPool's recycled worker threads instead of spinning up
+    a fresh QThread per search.
+    """
+
     def __init__(self, api_client, latitude, longitude, radius, api_key=None):
         super().__init__()
+        self.signals = APIWorkerSignals()
+        self.finished = self.signals.finished
+        self.error = self.signals.error
         self.api_client = api_client
         self.latitude = latitude
         self.longitude = longitude
         self.radius = radius
         self.api_key = api_key
-    
+        # Keep the Python wrapper alive after run(); the caller owns us
+        self.setAutoDelete(False)
+
+    def start(self):
+        """Dispatch this worker onto the global thread pool."""
+        QThreadPool.globalInstance().start(self)
+
     def run(self):
         """Run the API call in the background thread."""
         try:
             stations = self.api_client.get_charging_stations(
                 self.latitude, self.longitude, self.radius, self.api_key
             )
-            self.finished.emit(stations)
+            self.signals.finished.emit(stations)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+
+class MultiAPIWorker(QRunnable):
+    """Pooled worker for batched API calls across several search points."""
+
+    def __init__(self, api_client, points, api_key=None):
+        super().__init__()
+        self.signals = APIWorkerSignals()
+        self.finished = self.signals.finished
+        self.error = self.signals.error
+        self.api_client = api_client
+        self.points = points
+        self.api_key = api_key
+        self.setAutoDelete(False)
+
+    def start(self):
+        """Dispatch this worker onto the global thread pool."""
+        QThreadPool.globalInstance().start(self)
+
+    def run(self):
+        """Run the batched API calls in the background thread."""
+        try:
+            results = list(self.api_client.get_charging_stations_multi(
+                self.points, self.api_key
+            ))
+            self.signals.finished.emit(results)
+        except Exception as e:
+            self.signals.error.emit(str(e))
 
 
 class OpenChargeMapAPI(QObject):
     """Client for OpenChargeMap API."""
     
     BASE_URL = "https://api.openchargemap.io/v3/poi"
-    
+    REFERENCE_DATA_URL = "https://api.openchargemap.io/v3/referencedata"
+    CACHE_TTL_SECONDS = 24 * 3600
+    REF_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+    # Reference-data tables we resolve compact-mode IDs against, mapped to
+    # their key in the /referencedata response
+    _REF_TABLES = (
+        ('ConnectionType', 'ConnectionTypes'),
+        ('Level', 'Levels'),
+        ('CurrentType', 'CurrentTypes'),
+        ('UsageType', 'UsageTypes'),
+        ('StatusType', 'StatusTypes'),
+        ('Operator', 'Operators'),
+        ('SubmissionStatus', 'SubmissionStatusTypes'),
+    )
+
     def __init__(self):
         super().__init__()
-        if not REQUESTS_AVAILABLE:
-            raise ImportError("Requests library is not available. Please install it: pip install requests")
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'ChargeSpot-QGIS-Plugin/1.0 (Educational Use)'
-        })
+        # The session (and the requests import behind it) is created
+        # lazily on first use so plugin load stays fast
+        self._ref = None
+
+    @property
+    def session(self):
+        """The shared HTTP session, built on first access."""
+        return _get_session()
     
     def get_charging_stations(
         self, 
@@ -81,39 +351,85 @@ class OpenChargeMapAPI(QObject):
             'longitude': longitude,
             'distance': radius,
             'distanceunit': 'km',
-            'maxresults': max_results
+            'maxresults': max_results,
+            # Compact responses drop nested reference objects (roughly
+            # halving the payload); IDs are resolved via _ref_title below
+            'compact': 'true',
+            'verbose': 'false'
         }
         
         headers = {}
         if api_key:
             headers['X-API-Key'] = api_key
-        
+
+        # Check the on-disk cache before paying the network round trip.
+        # Coordinates are rounded (~100 m) so nearby repeat searches hit.
+        cache_key = hashlib.md5(
+            f'{round(latitude, 3)}:{round(longitude, 3)}:{round(radius, 1)}:{max_results}'.encode()
+        ).hexdigest()
+        cached_stations, cached_etag, cache_fresh = self._read_cache(cache_key)
+
+        if cached_stations is not None and cache_fresh:
+            if _DEBUG:
+                QgsMessageLog.logMessage(
+                    f"Cache hit for lat={latitude}, lon={longitude}, radius={radius}km "
+                    f"({len(cached_stations)} stations)",
+                    "ChargeSpot",
+                    Qgis.Info
+                )
+            return cached_stations
+
+        if cached_etag:
+            headers['If-None-Match'] = cached_etag
+
         try:
-            QgsMessageLog.logMessage(
-                f"Making API request to OpenChargeMap: lat={latitude}, lon={longitude}, radius={radius}km",
-                "ChargeSpot",
-                Qgis.Info
-            )
-            
-            # Build URL for debugging
-            import urllib.parse
-            full_url = f"{self.BASE_URL}?" + urllib.parse.urlencode(params)
-            QgsMessageLog.logMessage(f"Request URL: {full_url}", "ChargeSpot", Qgis.Info)
-            
-            response = self.session.get(
-                self.BASE_URL,
-                params=params,
-                headers=headers,
-                timeout=30
-            )
+            if _DEBUG:
+                QgsMessageLog.logMessage(
+                    f"Making API request to OpenChargeMap: lat={latitude}, lon={longitude}, radius={radius}km",
+                    "ChargeSpot",
+                    Qgis.Info
+                )
+
+                # Build URL for debugging
+                import urllib.parse
+                full_url = f"{self.BASE_URL}?" + urllib.parse.urlencode(params)
+                QgsMessageLog.logMessage(f"Request URL: {full_url}", "ChargeSpot", Qgis.Info)
+
+            # Throttle before hitting the network; any 429/5xx that still
+            # slips through is retried by the mounted adapter's Retry on
+            # the requests path and by _httpx_get_with_retries on httpx
+            _RATE_LIMITER.acquire()
+
+            session = self.session
+            if HTTPX_AVAILABLE and isinstance(session, httpx.Client):
+                # HTTP/2 path: the body arrives multiplexed, so it is read
+                # whole; giving up ijson streaming is the accepted cost of
+                # sharing one connection across concurrent searches
+                response = _httpx_get_with_retries(
+                    session,
+                    self.BASE_URL,
+                    params=params,
+                    headers=headers
+                )
+                streaming = False
+            else:
+                response = session.get(
+                    self.BASE_URL,
+                    params=params,
+                    headers=headers,
+                    timeout=30,
+                    stream=True
+                )
+                streaming = True
             
             # Log response details for debugging
-            QgsMessageLog.logMessage(
-                f"Response status: {response.status_code}, headers: {dict(response.headers)}",
-                "ChargeSpot",
-                Qgis.Info
-            )
-            
+            if _DEBUG:
+                QgsMessageLog.logMessage(
+                    f"Response status: {response.status_code}, headers: {dict(response.headers)}",
+                    "ChargeSpot",
+                    Qgis.Info
+                )
+
             if response.status_code == 403:
                 error_msg = (
                     f"Access forbidden (403). This could be due to:\n"
@@ -125,21 +441,45 @@ class OpenChargeMapAPI(QObject):
                 QgsMessageLog.logMessage(error_msg, "ChargeSpot", Qgis.Critical)
                 raise Exception(error_msg)
             
+            # Server confirmed our stale cache entry is still current
+            if response.status_code == 304 and cached_stations is not None:
+                if _DEBUG:
+                    QgsMessageLog.logMessage(
+                        f"Cache revalidated (304) for lat={latitude}, lon={longitude}",
+                        "ChargeSpot",
+                        Qgis.Info
+                    )
+                self._touch_cache(cache_key)
+                return cached_stations
+
             response.raise_for_status()
-            
-            data = response.json()
-            
+
+            if IJSON_AVAILABLE and streaming:
+                # Stream stations off the socket so network read, JSON
+                # parse and extraction overlap instead of running in
+                # sequence over the full body
+                with response:
+                    response.raw.decode_content = True
+                    stations = self._process_charging_stations(
+                        ijson.items(response.raw, 'item', use_float=True)
+                    )
+            else:
+                # Decode the (gzip-compressed) body directly from bytes;
+                # orjson is noticeably faster than the stdlib decoder
+                stations = self._process_charging_stations(_loads(response.content))
+
             QgsMessageLog.logMessage(
-                f"API response received: {len(data)} charging stations found",
+                f"API response received: {len(stations)} charging stations found",
                 "ChargeSpot",
                 Qgis.Info
             )
+
+            self._write_cache(cache_key, stations, response.headers.get('ETag'))
+            return stations
             
-            return self._process_charging_stations(data)
-            
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             error_msg = f"API request failed: {str(e)}"
-            if hasattr(e, 'response') and e.response is not None:
+            if getattr(e, 'response', None) is not None:
                 error_msg += f"\nResponse text: {e.response.text[:200]}"
             QgsMessageLog.logMessage(error_msg, "ChargeSpot", Qgis.Critical)
             raise Exception(error_msg)
@@ -148,53 +488,32 @@ class OpenChargeMapAPI(QObject):
             QgsMessageLog.logMessage(error_msg, "ChargeSpot", Qgis.Critical)
             raise Exception(error_msg)
     
-    def _process_charging_stations(self, raw_data: List[Dict]) -> List[Dict]:
+    def _process_charging_stations(self, raw_data: Iterable[Dict]) -> List[Dict]:
         """
         Process raw API data into a standardized format.
-        
+
         Args:
-            raw_data: Raw data from OpenChargeMap API
-            
+            raw_data: Raw station dicts from the OpenChargeMap API; may be
+                a fully-decoded list or a streaming iterator
+
         Returns:
             List of processed charging station dictionaries
         """
         processed_stations = []
-        
+        extract_station = self._extract_station
+        append_station = processed_stations.append
+
         for station in raw_data:
             try:
-                # Extract basic information
-                station_data = {
-                    'id': station.get('ID'),
-                    'name': self._safe_get_nested(station, ['AddressInfo', 'Title'], 'Unknown Station'),
-                    'address': self._build_address(station.get('AddressInfo', {})),
-                    'latitude': self._safe_get_nested(station, ['AddressInfo', 'Latitude']),
-                    'longitude': self._safe_get_nested(station, ['AddressInfo', 'Longitude']),
-                    'distance': station.get('AddressInfo', {}).get('Distance'),
-                    'access_type': self._safe_get_nested(station, ['UsageType', 'Title'], 'Unknown'),
-                    'operator': self._safe_get_nested(station, ['OperatorInfo', 'Title'], 'Unknown'),
-                    'status': self._safe_get_nested(station, ['StatusType', 'Title'], 'Unknown'),
-                    'verification_status': self._safe_get_nested(station, ['SubmissionStatus', 'Title'], 'Unknown'),
-                    'num_points': station.get('NumberOfPoints', 0),
-                    'cost': self._safe_get_nested(station, ['UsageCost'], 'Unknown'),
-                    'url': station.get('URL'),
-                    'phone': self._safe_get_nested(station, ['AddressInfo', 'ContactTelephone1']),
-                    'email': self._safe_get_nested(station, ['AddressInfo', 'ContactEmail']),
-                    'comments': station.get('GeneralComments'),
-                    'date_created': station.get('DateCreated'),
-                    'date_last_verified': station.get('DateLastVerified'),
-                }
-                
-                # Extract connection information
-                connections = station.get('Connections', [])
-                station_data['connections'] = self._process_connections(connections)
-                station_data['connection_types'] = self._get_connection_types(connections)
-                station_data['power_levels'] = self._get_power_levels(connections)
-                
-                # Only add stations with valid coordinates
-                if (station_data['latitude'] is not None and 
-                    station_data['longitude'] is not None):
-                    processed_stations.append(station_data)
-                    
+                # Skip stations without valid coordinates before paying for
+                # the full extraction
+                addr = station.get('AddressInfo')
+                if (not addr or addr.get('Latitude') is None
+                        or addr.get('Longitude') is None):
+                    continue
+
+                append_station(extract_station(station, addr))
+
             except Exception as e:
                 QgsMessageLog.logMessage(
                     f"Error processing station {station.get('ID', 'unknown')}: {str(e)}",
@@ -204,71 +523,338 @@ class OpenChargeMapAPI(QObject):
                 continue
         
         return processed_stations
-    
-    def _safe_get_nested(self, data: Dict, keys: List[str], default=None):
-        """Safely get nested dictionary values."""
-        current = data
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
+
+    def _get_ref_data(self) -> Dict:
+        """
+        Get the ID -> Title reference tables, fetching them once per session.
+
+        Compact API responses replace nested reference objects (connection
+        types, usage types, operators, ...) with bare IDs; this table lets
+        us resolve them with O(1) dict lookups.
+
+        Returns:
+            Dict mapping table name to {id: title} dictionaries
+        """
+        if self._ref is None:
+            # The tables change rarely; a disk copy makes cold starts free
+            self._ref = self._read_ref_cache()
+        if self._ref is None:
+            try:
+                _RATE_LIMITER.acquire()
+                response = self.session.get(self.REFERENCE_DATA_URL, timeout=30)
+                response.raise_for_status()
+                raw = _loads(response.content)
+                self._ref = {
+                    name: {
+                        item.get('ID'): item.get('Title')
+                        for item in raw.get(raw_key, [])
+                    }
+                    for name, raw_key in self._REF_TABLES
+                }
+                self._write_ref_cache(self._ref)
+            except Exception as e:
+                QgsMessageLog.logMessage(
+                    f"Failed to fetch reference data: {str(e)}",
+                    "ChargeSpot",
+                    Qgis.Warning
+                )
+                # Remember the failure so we do not retry per station
+                self._ref = {}
+        return self._ref
+
+    def _read_ref_cache(self) -> Optional[Dict]:
+        """Load the persisted reference tables, or None if absent/stale."""
+        cache_dir = self._cache_dir()
+        if cache_dir is None:
+            return None
+
+        ref_path = os.path.join(cache_dir, 'referencedata.json')
+        try:
+            age = time.time() - os.path.getmtime(ref_path)
+            if age >= self.REF_CACHE_TTL_SECONDS:
+                return None
+            with open(ref_path, 'rb') as f:
+                raw = _loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        # JSON stringifies the integer ID keys; convert them back, skipping
+        # entries whose key does not parse (an item with a null ID is
+        # serialized as "null" and must not poison the whole table)
+        ref = {}
+        for table, entries in raw.items():
+            converted = {}
+            for ref_id, title in entries.items():
+                try:
+                    converted[int(ref_id)] = title
+                except (TypeError, ValueError):
+                    continue
+            ref[table] = converted
+        return ref
+
+    def _write_ref_cache(self, ref: Dict):
+        """Persist the reference tables next to the response cache."""
+        cache_dir = self._cache_dir()
+        if cache_dir is None:
+            return
+        try:
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(ref, option=orjson.OPT_NON_STR_KEYS)
             else:
-                return default
-        return current if current is not None else default
-    
-    def _build_address(self, address_info: Dict) -> str:
+                payload = json.dumps(ref).encode('utf-8')
+            with open(os.path.join(cache_dir, 'referencedata.json'), 'wb') as f:
+                f.write(payload)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def _ref_title(self, table: str, ref_id, default='Unknown'):
+        """Resolve a compact-mode reference ID to its title."""
+        if ref_id is None:
+            return default
+        return self._get_ref_data().get(table, _EMPTY).get(ref_id, default)
+
+    def _cache_dir(self) -> Optional[str]:
+        """Get (and create) the on-disk cache directory, or None on failure."""
+        try:
+            cache_dir = os.path.join(
+                QgsApplication.qgisSettingsDirPath(), 'chargespot_cache'
+            )
+            os.makedirs(cache_dir, exist_ok=True)
+            return cache_dir
+        except Exception:
+            return None
+
+    def _read_cache(self, cache_key: str) -> Tuple[Optional[List[Dict]], Optional[str], bool]:
+        """
+        Read a cached station list.
+
+        Args:
+            cache_key: Hash of the search parameters
+
+        Returns:
+            Tuple of (stations or None, stored ETag or None, freshness flag)
+        """
+        cache_dir = self._cache_dir()
+        if cache_dir is None:
+            return None, None, False
+
+        cache_path = os.path.join(cache_dir, f'{cache_key}.json')
+        etag_path = os.path.join(cache_dir, f'{cache_key}.etag')
+
+        try:
+            age = time.time() - os.path.getmtime(cache_path)
+            with open(cache_path, 'rb') as f:
+                stations = _loads(f.read())
+        except (OSError, ValueError):
+            return None, None, False
+
+        etag = None
+        try:
+            with open(etag_path, 'r') as f:
+                etag = f.read().strip() or None
+        except OSError:
+            pass
+
+        return stations, etag, age < self.CACHE_TTL_SECONDS
+
+    def _write_cache(self, cache_key: str, stations: List[Dict], etag: Optional[str]):
+        """Store a processed station list (and its ETag) on disk."""
+        cache_dir = self._cache_dir()
+        if cache_dir is None:
+            return
+
+        try:
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(stations)
+            else:
+                payload = json.dumps(stations).encode('utf-8')
+            with open(os.path.join(cache_dir, f'{cache_key}.json'), 'wb') as f:
+                f.write(payload)
+            if etag:
+                with open(os.path.join(cache_dir, f'{cache_key}.etag'), 'w') as f:
+                    f.write(etag)
+        except OSError:
+            # A failed cache write must never break the search itself
+            pass
+
+    def _touch_cache(self, cache_key: str):
+        """Refresh the TTL of a revalidated cache entry."""
+        cache_dir = self._cache_dir()
+        if cache_dir is None:
+            return
+        try:
+            os.utime(os.path.join(cache_dir, f'{cache_key}.json'), None)
+        except OSError:
+            pass
+
+    def _extract_station(self, station: Dict, address_info: Optional[Dict] = None) -> Dict:
+        """
+        Extract one station into the standardized format.
+
+        The nested lookups are inlined as plain dict.get chains rather than
+        going through _safe_get_nested, since this runs ~15 times per
+        station on every API response.
+
+        Args:
+            station: Raw station dictionary from the API
+            address_info: The station's AddressInfo dict, if the caller
+                already pulled it out for the coordinate check
+
+        Returns:
+            Processed charging station dictionary
+        """
+        if address_info is None:
+            address_info = station.get('AddressInfo') or _EMPTY
+        usage_type = station.get('UsageType') or _EMPTY
+        operator_info = station.get('OperatorInfo') or _EMPTY
+        status_type = station.get('StatusType') or _EMPTY
+        submission_status = station.get('SubmissionStatus') or _EMPTY
+
+        try:
+            (station_id, url, num_points, comments,
+             date_created, date_last_verified, cost) = _BASIC_GETTER(station)
+        except KeyError:
+            get = station.get
+            station_id = get('ID')
+            url = get('URL')
+            num_points = get('NumberOfPoints', 0)
+            comments = get('GeneralComments')
+            date_created = get('DateCreated')
+            date_last_verified = get('DateLastVerified')
+            cost = get('UsageCost')
+
+        station_data = {
+            'id': station_id,
+            'name': address_info.get('Title') or 'Unknown Station',
+            'address': self._build_address(address_info),
+            'latitude': address_info.get('Latitude'),
+            'longitude': address_info.get('Longitude'),
+            'distance': address_info.get('Distance'),
+            'access_type': usage_type.get('Title') or self._ref_title('UsageType', station.get('UsageTypeID')),
+            'operator': operator_info.get('Title') or self._ref_title('Operator', station.get('OperatorID')),
+            'status': status_type.get('Title') or self._ref_title('StatusType', station.get('StatusTypeID')),
+            'verification_status': submission_status.get('Title') or self._ref_title('SubmissionStatus', station.get('SubmissionStatusTypeID')),
+            'num_points': num_points,
+            'cost': cost or 'Unknown',
+            'url': url,
+            'phone': address_info.get('ContactTelephone1'),
+            'email': address_info.get('ContactEmail'),
+            'comments': comments,
+            'date_created': date_created,
+            'date_last_verified': date_last_verified,
+        }
+
+        # Extract connection information in a single pass
+        connections = station.get('Connections', [])
+        (station_data['connections'],
+         station_data['connection_types'],
+         station_data['power_levels']) = self._process_connections_fused(connections)
+
+        return station_data
+
+    @staticmethod
+    def _build_address(address_info: Dict) -> str:
         """Build a formatted address string."""
-        parts = []
-        
-        if address_info.get('AddressLine1'):
-            parts.append(address_info['AddressLine1'])
-        if address_info.get('Town'):
-            parts.append(address_info['Town'])
-        if address_info.get('StateOrProvince'):
-            parts.append(address_info['StateOrProvince'])
-        if address_info.get('Postcode'):
-            parts.append(address_info['Postcode'])
-        if address_info.get('Country', {}).get('Title'):
-            parts.append(address_info['Country']['Title'])
-            
+        parts = [
+            address_info[key] for key in _ADDRESS_KEYS if address_info.get(key)
+        ]
+        country = (address_info.get('Country') or _EMPTY).get('Title')
+        if country:
+            parts.append(country)
+
         return ', '.join(parts) if parts else 'Unknown Address'
     
-    def _process_connections(self, connections: List[Dict]) -> List[Dict]:
-        """Process connection information."""
+    def _process_connections_fused(self, connections: List[Dict]) -> Tuple[List[Dict], List[str], List[str]]:
+        """
+        Process connection information in one pass.
+
+        Walks the connection list once, building the processed dicts and
+        the unique connection-type and power-level lists together instead
+        of three separate traversals.
+
+        Args:
+            connections: Raw connection dictionaries from the API
+
+        Returns:
+            Tuple of (processed connections, unique types, unique levels)
+        """
         processed_connections = []
-        
+        types = set()
+        levels = set()
+
         for conn in connections:
+            conn_type = ((conn.get('ConnectionType') or _EMPTY).get('Title')
+                         or self._ref_title('ConnectionType', conn.get('ConnectionTypeID'), None))
+            level = ((conn.get('Level') or _EMPTY).get('Title')
+                     or self._ref_title('Level', conn.get('LevelID'), None))
+
             connection_data = {
                 'id': conn.get('ID'),
-                'type': self._safe_get_nested(conn, ['ConnectionType', 'Title'], 'Unknown'),
-                'level': self._safe_get_nested(conn, ['Level', 'Title'], 'Unknown'),
+                'type': conn_type or 'Unknown',
+                'level': level or 'Unknown',
                 'power_kw': conn.get('PowerKW'),
-                'current_type': self._safe_get_nested(conn, ['CurrentType', 'Title'], 'Unknown'),
+                'current_type': ((conn.get('CurrentType') or _EMPTY).get('Title')
+                                 or self._ref_title('CurrentType', conn.get('CurrentTypeID'))),
                 'quantity': conn.get('Quantity', 1),
-                'status': self._safe_get_nested(conn, ['StatusType', 'Title'], 'Unknown'),
+                'status': ((conn.get('StatusType') or _EMPTY).get('Title')
+                           or self._ref_title('StatusType', conn.get('StatusTypeID'))),
                 'comments': conn.get('Comments')
             }
             processed_connections.append(connection_data)
-            
-        return processed_connections
-    
-    def _get_connection_types(self, connections: List[Dict]) -> List[str]:
-        """Get unique connection types."""
-        types = set()
-        for conn in connections:
-            conn_type = self._safe_get_nested(conn, ['ConnectionType', 'Title'])
+
             if conn_type:
                 types.add(conn_type)
-        return list(types)
-    
-    def _get_power_levels(self, connections: List[Dict]) -> List[str]:
-        """Get unique power levels."""
-        levels = set()
-        for conn in connections:
-            level = self._safe_get_nested(conn, ['Level', 'Title'])
             if level:
                 levels.add(level)
-        return list(levels)
+
+        return processed_connections, list(types), list(levels)
     
+    def get_charging_stations_multi(
+        self,
+        points: List[Tuple[float, float, float]],
+        api_key: Optional[str] = None,
+        max_workers: int = 6
+    ):
+        """
+        Get charging stations for several search points concurrently.
+
+        Requests fan out over the shared session's keep-alive pool, so a
+        scan of K points takes roughly ceil(K / max_workers) round trips
+        instead of K.
+
+        Args:
+            points: List of (latitude, longitude, radius) tuples
+            api_key: Optional API key for higher rate limits
+            max_workers: Maximum number of concurrent requests
+
+        Yields:
+            Lists of processed charging station dictionaries, one per
+            point, in completion order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.get_charging_stations, latitude, longitude, radius, api_key
+                )
+                for latitude, longitude, radius in points
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def get_multi_async(
+        self,
+        points: List[Tuple[float, float, float]],
+        api_key: Optional[str] = None
+    ) -> MultiAPIWorker:
+        """
+        Get charging stations for several search points asynchronously.
+
+        Returns:
+            MultiAPIWorker thread that can be connected to signals
+        """
+        worker = MultiAPIWorker(self, points, api_key)
+        return worker
+
     def get_async(self, latitude: float, longitude: float, radius: float = 10.0, api_key: Optional[str] = None) -> APIWorker:
         """
         Get charging stations asynchronously.
@@ -1,14 +1,32 @@
+import math
+import os
 import os.path
-from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, Qt
+from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, Qt, QTimer
 from qgis.PyQt.QtGui import QIcon
-from qgis.PyQt.QtWidgets import (QAction, QMessageBox, QWidget, QHBoxLayout, 
-                               QVBoxLayout, QSlider, QLabel, QFrame, QPushButton,
-                               QApplication)
+from qgis.PyQt.QtWidgets import (QAction, QMessageBox, QWidget, QHBoxLayout,
+                               QVBoxLayout, QSlider, QLabel, QFrame, QPushButton)
 from qgis.core import (QgsProject, QgsPointXY, QgsVectorLayer, QgsMarkerSymbol, 
                       QgsFeature, QgsGeometry, QgsCoordinateTransform, 
-                      QgsCoordinateReferenceSystem, QgsFillSymbol, QgsPolygon, QgsLineString, QgsPoint, QgsWkbTypes)
+                      QgsCoordinateReferenceSystem, QgsFillSymbol, QgsPolygon, QgsLineString, QgsWkbTypes,
+                      QgsUnitTypes, Qgis, QgsMessageLog, QgsFeatureRequest,
+                      QgsRectangle)
 from qgis.gui import QgsMapToolEmitPoint, QgsMapTool, QgsRubberBand, QgsMapToolIdentify
 
+# Debug logging is opt-in; print() flushes synchronously to the QGIS
+# Python console and blocks the UI thread on some platforms
+_DEBUG = os.environ.get('CHARGESPOT_DEBUG') == '1'
+
+# Unit circle vertices (5-degree intervals), precomputed once so each
+# preview only scales and translates instead of re-running the trig.
+# Kept as two closed coordinate columns so circle construction is a
+# pair of flat comprehensions feeding QgsLineString directly, with no
+# per-vertex pair objects
+_UNIT_COS = [math.cos(2 * math.pi * i / 72) for i in range(72)]
+_UNIT_SIN = [math.sin(2 * math.pi * i / 72) for i in range(72)]
+_UNIT_COS.append(_UNIT_COS[0])
+_UNIT_SIN.append(_UNIT_SIN[0])
+
+
 class RadiusMapTool(QgsMapTool):
     """Custom map tool with floating radius control."""
     
@@ -19,7 +37,16 @@ class RadiusMapTool(QgsMapTool):
         self.search_callback = search_callback
         self.dragging = False
         self.center_point = None
-        
+
+        # Coalesce slider bursts into at most one preview per interval;
+        # each preview costs a transform + buffer + layer edit + refresh
+        self._pending_radius = None
+        self._last_emitted_radius = None
+        self._preview_timer = QTimer(self.canvas)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(75)
+        self._preview_timer.timeout.connect(self._fire_preview)
+
         # Create floating control widget
         self.control_widget = QFrame(self.canvas)
         self.control_widget.setStyleSheet("""
@@ -42,8 +69,9 @@ class RadiusMapTool(QgsMapTool):
                 background-color: #166294;
             }
         """)
-        self.control_widget.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.Tool)
-        
+        # Plain child overlay of the canvas; window flags would force a
+        # native top-level window per tool activation
+
         # Create main layout
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(10, 5, 10, 5)
@@ -91,36 +119,55 @@ class RadiusMapTool(QgsMapTool):
         """Handle mouse press events on the canvas."""
         if event.button() == Qt.LeftButton:
             self.center_point = self.toMapCoordinates(event.pos())
-            # Call the preview callback with initial point and radius
-            self.preview_callback(self.center_point, self.radius_slider.value())
-            # Show control widget near the click point
+            # Call the preview callback with initial point and radius;
+            # a new center invalidates the last-emitted radius skip
+            self._last_emitted_radius = self.radius_slider.value()
+            self.preview_callback(self.center_point, self._last_emitted_radius)
+            # Show control widget near the click point, positioned in
+            # canvas-local pixels (the widget is a child of the canvas)
             widget_pos = event.pos()
             # Position the widget 50 pixels to the right and 30 pixels above the click point
             widget_pos.setX(widget_pos.x() + 50)
             widget_pos.setY(widget_pos.y() - self.control_widget.height() - 30)
-            
-            # Get the global position
-            global_pos = self.canvas.mapToGlobal(widget_pos)
-            
-            # Ensure the widget stays within the screen bounds
-            screen = QApplication.primaryScreen().geometry()
-            if global_pos.x() + self.control_widget.width() > screen.width():
+
+            # Ensure the widget stays within the canvas bounds
+            canvas_rect = self.canvas.rect()
+            if widget_pos.x() + self.control_widget.width() > canvas_rect.width():
                 # If it would go off the right edge, place it to the left of the click point instead
                 widget_pos.setX(event.pos().x() - self.control_widget.width() - 50)
-            
-            self.control_widget.move(self.canvas.mapToGlobal(widget_pos))
+            if widget_pos.y() < 0:
+                widget_pos.setY(event.pos().y() + 30)
+
+            self.control_widget.move(widget_pos)
             self.control_widget.show()
     
     def on_radius_changed(self, value):
         """Handle radius slider value changes."""
         self.value_label.setText(f"{value} km")
         if self.center_point:
-            self.preview_callback(self.center_point, value)
-    
+            # Restarting the timer collapses a fast drag into one preview
+            self._pending_radius = value
+            self._preview_timer.start()
+
+    def _fire_preview(self):
+        """Run the debounced preview for the last slider value."""
+        if (self.center_point and self._pending_radius is not None
+                and self._pending_radius != self._last_emitted_radius):
+            self._last_emitted_radius = self._pending_radius
+            self.preview_callback(self.center_point, self._pending_radius)
+
     def on_search_clicked(self):
         """Handle search button click."""
         if self.center_point:
-            self.search_callback(self.center_point, self.radius_slider.value())
+            # Silence the slider and drop any pending debounce so a
+            # nudge during the search cannot queue preview work behind it
+            self._preview_timer.stop()
+            self._pending_radius = None
+            self.radius_slider.blockSignals(True)
+            try:
+                self.search_callback(self.center_point, self.radius_slider.value())
+            finally:
+                self.radius_slider.blockSignals(False)
             self.control_widget.hide()
             # Deactivate the map tool after search
             self.canvas.unsetMapTool(self)
@@ -131,6 +178,28 @@ class RadiusMapTool(QgsMapTool):
         super().deactivate()
 
 
+class _LazyStationDict(dict):
+    """Station attributes whose list fields split on first access.
+
+    The results layer stores connection types and power levels as
+    comma-joined strings; the split lists are only materialized if a
+    consumer actually reads them, and are memoized back afterwards."""
+
+    _SPLIT_KEYS = ('connection_types', 'power_levels')
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if key in self._SPLIT_KEYS and isinstance(value, str):
+            value = value.split(', ') if value else []
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+
 class ChargingStationIdentifyTool(QgsMapToolIdentify):
     """Custom identify tool for charging station features."""
     
@@ -140,33 +209,66 @@ class ChargingStationIdentifyTool(QgsMapToolIdentify):
         self.target_layer = layer
         self.info_callback = info_callback
         self.setCursor(Qt.PointingHandCursor)
+        # Field names change only with the layer schema; caching them
+        # keeps the per-click attribute read to one bulk call
+        self._field_names = [f.name() for f in layer.fields()]
+        layer.updatedFields.connect(self._refresh_field_names)
+
+    def _refresh_field_names(self):
+        """Re-read field names after a schema change."""
+        self._field_names = [f.name() for f in self.target_layer.fields()]
     
     def canvasReleaseEvent(self, event):
         """Handle mouse release events to identify features."""
         if event.button() == Qt.LeftButton:
-            # Identify features at the clicked point
-            results = self.identify(event.x(), event.y(), [self.target_layer], QgsMapToolIdentify.TopDownStopAtFirst)
-            
-            if results:
-                # Get the first identified feature
-                result = results[0]
-                feature = result.mFeature
-                
-                # Create station data dictionary from feature attributes
-                station_data = {}
-                fields = result.mLayer.fields()
-                
-                for i, field in enumerate(fields):
-                    field_name = field.name()
-                    field_value = feature.attribute(i)
-                    station_data[field_name] = field_value
-                
-                # Convert some string fields back to lists if needed
-                if 'connection_types' in station_data and station_data['connection_types']:
-                    station_data['connection_types'] = station_data['connection_types'].split(', ')
-                if 'power_levels' in station_data and station_data['power_levels']:
-                    station_data['power_levels'] = station_data['power_levels'].split(', ')
-                
+            # Query the provider's spatial index directly with a small
+            # rectangle around the click; the generic identify() path
+            # scans linearly and builds result objects we don't need
+            map_point = self.toMapCoordinates(event.pos())
+            tolerance = self.canvas.mapUnitsPerPixel() * 4
+            rect = QgsRectangle(
+                map_point.x() - tolerance, map_point.y() - tolerance,
+                map_point.x() + tolerance, map_point.y() + tolerance
+            )
+            # setFilterRect is interpreted in the layer CRS; if the
+            # project CRS changed since the layer was built, move the
+            # click rectangle (and the point used for distance ranking)
+            # into the layer CRS first
+            layer_crs = self.target_layer.crs()
+            canvas_crs = self.canvas.mapSettings().destinationCrs()
+            if canvas_crs != layer_crs:
+                try:
+                    to_layer = QgsCoordinateTransform(
+                        canvas_crs, layer_crs, QgsProject.instance()
+                    )
+                    rect = to_layer.transformBoundingBox(rect)
+                    map_point = to_layer.transform(map_point)
+                except Exception:
+                    return
+            # The provider's spatial index narrows candidates to the
+            # rectangle; among those, pick the station nearest the click
+            # so dense clusters resolve predictably
+            request = QgsFeatureRequest().setFilterRect(rect)
+            feature = None
+            best_distance = None
+            for candidate in self.target_layer.getFeatures(request):
+                point = candidate.geometry().asPoint()
+                dx = point.x() - map_point.x()
+                dy = point.y() - map_point.y()
+                distance = dx * dx + dy * dy
+                if best_distance is None or distance < best_distance:
+                    best_distance = distance
+                    feature = candidate
+
+            if feature is not None:
+                # One bulk attributes() call instead of a per-field
+                # attribute(i) round trip; list fields split lazily on
+                # first read
+                station_data = _LazyStationDict(
+                    zip(self._field_names, feature.attributes())
+                )
+
+
                 # Get geometry for coordinates
                 geom = feature.geometry()
                 if geom.type() == QgsWkbTypes.PointGeometry:
@@ -181,10 +283,14 @@ class ChargingStationIdentifyTool(QgsMapToolIdentify):
 from .charge_spot_dialog import ChargeSpotDialog
 from .api_client import OpenChargeMapAPI
 
+# Memoized translations; QCoreApplication.translate is paid on every
+# plugin load otherwise
+_TR_CACHE = {}
+
 
 class ChargeSpot:
 
-    def __init__(self, iface):
+    def __init__(self, iface, api_client=None):
         # Save reference to the QGIS interface
         self.iface = iface
         # initialize plugin directory
@@ -211,12 +317,73 @@ class ChargeSpot:
         
         # Initialize the dialog and API client
         self.dlg = None
-        self.api_client = OpenChargeMapAPI()
+        # Reuse the process-wide client when provided so its pooled HTTP
+        # session is not torn down on plugin reload
+        self.api_client = api_client if api_client is not None else OpenChargeMapAPI()
         self.map_tool = None
         self.identify_tool = None
         self.current_layer = None
+        # Content hash of the last result set; repeat searches over the
+        # same area reuse the existing layer instead of rebuilding it
+        self._last_results_hash = None
         self.center_point_layer = None
         self.search_area_layer = None
+        # Canvas overlay for the interactive radius preview; a rubber band
+        # avoids rewriting a memory layer on every slider tick
+        self._preview_band = None
+        # Long-lived feature ids so previews move geometry in place
+        # instead of truncating and re-adding per update
+        self._center_fid = None
+        self._search_area_fid = None
+        # Skip previews whose (point, radius) matches the last one drawn
+        self._last_preview_key = None
+        # Current center point, kept here so reads skip the feature iterator
+        self._center_point_xy = None
+        # Suppresses dialog radius echoes while we push values into the
+        # dialog ourselves, so one user action renders exactly once
+        self._suspend_preview = False
+        # Last radius relayed from the dialog; identical re-emissions
+        # are dropped before any geometry work
+        self._last_dialog_radius = None
+
+        # Cache CRS/transform objects; rebuilding them on every click or
+        # slider tick costs milliseconds each
+        self._wgs84_crs = QgsCoordinateReferenceSystem("EPSG:4326")
+        self._transform_cache = {}
+        # The WGS84 center is invariant while the radius slider drags;
+        # cache it keyed by (x, y, project CRS)
+        self._wgs84_center_cache = None
+        # Memoize built circles so scrubbing back to a recent radius
+        # skips the vertex loop and transform; insertion-ordered, capped
+        self._circle_cache = {}
+        # Whether display coordinates need a WGS84 round trip; refreshed
+        # on CRS change so hot paths branch on a plain bool
+        self._needs_xform = (
+            QgsProject.instance().crs().authid() != "EPSG:4326"
+        )
+        # Stale transforms must not survive a project CRS switch
+        QgsProject.instance().crsChanged.connect(self._clear_transform_cache)
+
+    _CIRCLE_CACHE_MAX = 16
+
+    def _clear_transform_cache(self):
+        """Drop cached transforms when the project CRS changes."""
+        self._transform_cache.clear()
+        self._circle_cache.clear()
+        self._needs_xform = (
+            QgsProject.instance().crs().authid() != "EPSG:4326"
+        )
+
+    def _get_transform(self, source_crs, dest_crs):
+        """Get a cached QgsCoordinateTransform between two CRS."""
+        key = (source_crs.authid(), dest_crs.authid())
+        transform = self._transform_cache.get(key)
+        if transform is None:
+            transform = QgsCoordinateTransform(
+                source_crs, dest_crs, QgsProject.instance()
+            )
+            self._transform_cache[key] = transform
+        return transform
 
     # noinspection PyMethodMayBeStatic
     def tr(self, message):
@@ -230,8 +397,12 @@ class ChargeSpot:
         :returns: Translated version of message.
         :rtype: QString
         """
-        # noinspection PyTypeChecker,PyArgumentList,PyCallByClass
-        return QCoreApplication.translate('ChargeSpot', message)
+        translated = _TR_CACHE.get(message)
+        if translated is None:
+            # noinspection PyTypeChecker,PyArgumentList,PyCallByClass
+            translated = QCoreApplication.translate('ChargeSpot', message)
+            _TR_CACHE[message] = translated
+        return translated
 
     def add_action(
         self,
@@ -324,7 +495,7 @@ class ChargeSpot:
         """Removes the plugin menu item and icon from QGIS GUI."""
         for action in self.actions:
             self.iface.removePluginWebMenu(
-                self.tr(u'&ChargeSpot'),
+                self.menu,
                 action)
             self.iface.removeToolBarIcon(action)
         
@@ -332,6 +503,8 @@ class ChargeSpot:
         if self.center_point_layer:
             QgsProject.instance().removeMapLayer(self.center_point_layer.id())
 
+        self._clear_preview_band()
+
     def setup_map_tool(self):
         """Setup the map tool for selecting center points."""
         if self.map_tool is None:
@@ -396,102 +569,155 @@ class ChargeSpot:
             self.search_area_layer.renderer().setSymbol(symbol)
             self.search_area_layer.triggerRepaint()
             
-    def update_search_area(self, radius_km):
-        """Update the search area circle based on center point and radius.
-        Creates the circle in WGS84 (matching API behavior) then transforms to project CRS."""
-        if not self.center_point_layer or self.center_point_layer.featureCount() == 0:
-            return
-            
-        # Get the center point in project CRS
-        center_feature = next(self.center_point_layer.getFeatures())
-        center_point = center_feature.geometry().asPoint()
-        
+    def _build_search_circle(self, center_point, radius_km):
+        """Build the search-radius circle geometry in the project CRS.
+
+        Recently built circles are memoized by (center, radius, CRS) so
+        scrubbing the slider back over a value reuses the geometry."""
+        key = (round(center_point.x(), 6), round(center_point.y(), 6),
+               radius_km, QgsProject.instance().crs().authid())
+        circle = self._circle_cache.get(key)
+        if circle is None:
+            circle = self._compute_search_circle(center_point, radius_km)
+            if len(self._circle_cache) >= self._CIRCLE_CACHE_MAX:
+                del self._circle_cache[next(iter(self._circle_cache))]
+            self._circle_cache[key] = circle
+        return circle
+
+    def _compute_search_circle(self, center_point, radius_km):
+        """Compute the circle geometry in the project CRS.
+
+        The circle is computed in WGS84 (matching the API's spherical
+        distance) and transformed back for display."""
         project_crs = QgsProject.instance().crs()
-        wgs84_crs = QgsCoordinateReferenceSystem("EPSG:4326")
-        
-        # Convert center point to WGS84 (same as API uses)
-        if project_crs.authid() != "EPSG:4326":
-            transform_to_wgs84 = QgsCoordinateTransform(project_crs, wgs84_crs, QgsProject.instance())
-            try:
-                wgs84_center = transform_to_wgs84.transform(center_point)
-            except Exception as e:
-                print(f"Transform to WGS84 failed: {e}")
-                wgs84_center = center_point  # Fallback
+        wgs84_crs = self._wgs84_crs
+
+        # Meter-based projected CRS: buffer directly in map units and skip
+        # the WGS84 round trip entirely
+        if (not project_crs.isGeographic()
+                and project_crs.mapUnits() == QgsUnitTypes.DistanceMeters):
+            radius = radius_km * 1000.0
+            if project_crs.authid() == "EPSG:3857":
+                # Web Mercator map units shrink by cos(lat) on the ground
+                latitude = 2.0 * math.atan(
+                    math.exp(center_point.y() / 6378137.0)
+                ) - math.pi / 2.0
+                radius /= math.cos(latitude)
+            center_x = center_point.x()
+            center_y = center_point.y()
+            return self._polygon_from_xy(
+                [center_x + radius * cos_a for cos_a in _UNIT_COS],
+                [center_y + radius * sin_a for sin_a in _UNIT_SIN]
+            )
+
+        # Convert center point to WGS84 (same as API uses); reuse the
+        # cached result while only the radius changes
+        cache_key = (center_point.x(), center_point.y(), project_crs.authid())
+        if (self._wgs84_center_cache is not None
+                and self._wgs84_center_cache[0] == cache_key):
+            wgs84_center = self._wgs84_center_cache[1]
         else:
-            wgs84_center = center_point
-        
-        # Create circle in WGS84 using geodetic buffer (matches API spherical distance)
-        wgs84_point_geom = QgsGeometry.fromPointXY(wgs84_center)
-        
-        # Use geodetic buffer for accurate spherical distance (like the API)
-        radius_meters = radius_km * 1000
-        wgs84_circle = wgs84_point_geom.buffer(radius_meters / 111000.0, 36)  # Approximate degrees
-        
-        # For more accurate geodetic buffering, let's use a proper approach
-        # Create points around the circle using haversine-like calculation
-        import math
-        
-        # Create a more accurate circle using multiple points
-        circle_points = []
-        num_points = 72  # 5-degree intervals
-        
-        for i in range(num_points):
-            angle = 2 * math.pi * i / num_points
-            
-            # Calculate offset in degrees (rough approximation)
-            lat_offset = (radius_km / 111.0) * math.cos(angle)  # 111 km per degree latitude
-            lon_offset = (radius_km / (111.0 * math.cos(math.radians(wgs84_center.y())))) * math.sin(angle)
-            
-            point_lat = wgs84_center.y() + lat_offset
-            point_lon = wgs84_center.x() + lon_offset
-            
-            circle_points.append([point_lon, point_lat])
-        
-        # Close the polygon
-        circle_points.append(circle_points[0])
-        
-        # Create polygon from points
-        ring = QgsLineString()
-        for point in circle_points:
-            ring.addVertex(QgsPoint(point[0], point[1]))
-        
-        polygon = QgsPolygon()
-        polygon.setExteriorRing(ring)
-        wgs84_circle = QgsGeometry(polygon)
-        
+            if self._needs_xform:
+                transform_to_wgs84 = self._get_transform(project_crs, wgs84_crs)
+                try:
+                    wgs84_center = transform_to_wgs84.transform(center_point)
+                except Exception as e:
+                    QgsMessageLog.logMessage(
+                        f"Transform to WGS84 failed: {e}",
+                        "ChargeSpot", Qgis.Warning
+                    )
+                    wgs84_center = center_point  # Fallback
+            else:
+                wgs84_center = center_point
+            self._wgs84_center_cache = (cache_key, wgs84_center)
+
+        # Build the circle vertices directly; going through a point
+        # geometry and a GEOS buffer() allocates three objects for a
+        # ring we can compute ourselves.
+        # Scale the precomputed unit circle into degree offsets
+        # (111 km per degree latitude, rough approximation)
+        center_lon = wgs84_center.x()
+        center_lat = wgs84_center.y()
+        lat_scale = radius_km / 111.0
+        lon_scale = radius_km / (111.0 * math.cos(math.radians(center_lat)))
+
+        wgs84_circle = self._polygon_from_xy(
+            [center_lon + lon_scale * sin_a for sin_a in _UNIT_SIN],
+            [center_lat + lat_scale * cos_a for cos_a in _UNIT_COS]
+        )
+
         # Transform the circle back to project CRS for display
-        if project_crs.authid() != "EPSG:4326":
-            transform_from_wgs84 = QgsCoordinateTransform(wgs84_crs, project_crs, QgsProject.instance())
+        if self._needs_xform:
+            transform_from_wgs84 = self._get_transform(wgs84_crs, project_crs)
             try:
                 wgs84_circle.transform(transform_from_wgs84)
             except Exception as e:
-                print(f"Transform from WGS84 failed: {e}")
-        
-        # Create or clear the search area layer
+                QgsMessageLog.logMessage(
+                    f"Transform from WGS84 failed: {e}",
+                    "ChargeSpot", Qgis.Warning
+                )
+
+        return wgs84_circle
+
+    @staticmethod
+    def _polygon_from_xy(xs, ys):
+        """Build a polygon geometry from closed x and y coordinate lists."""
+        # The coordinate-list constructor builds the ring in one C-level
+        # call instead of a QgsPoint allocation and addVertex dispatch
+        # per vertex
+        ring = QgsLineString(xs, ys)
+
+        polygon = QgsPolygon()
+        polygon.setExteriorRing(ring)
+        return QgsGeometry(polygon)
+
+    def _get_preview_band(self):
+        """Get (and lazily create) the preview rubber band."""
+        if self._preview_band is None:
+            from qgis.PyQt.QtGui import QColor
+            band = QgsRubberBand(self.iface.mapCanvas(), QgsWkbTypes.PolygonGeometry)
+            # Match the search-area layer symbology
+            band.setFillColor(QColor(31, 120, 180, 64))
+            band.setStrokeColor(QColor(31, 120, 180))
+            band.setWidth(2)
+            self._preview_band = band
+        return self._preview_band
+
+    def _clear_preview_band(self):
+        """Remove the preview circle from the canvas."""
+        if self._preview_band is not None:
+            self._preview_band.reset(QgsWkbTypes.PolygonGeometry)
+
+    def update_search_area(self, radius_km):
+        """Update the persistent search area circle based on center point and radius.
+        Creates the circle in WGS84 (matching API behavior) then transforms to project CRS."""
+        # Read the cached center point; spinning up a feature iterator
+        # for a single-feature layer is pure overhead
+        center_point = self._center_point_xy
+        if center_point is None:
+            return
+
+        circle = self._build_search_circle(center_point, radius_km)
+
+        # Create the search area layer once, then update the polygon
+        # geometry in place
         if not self.search_area_layer:
             self.create_search_area_layer()
+
+        provider = self.search_area_layer.dataProvider()
+        if self._search_area_fid is None:
+            feature = QgsFeature()
+            feature.setGeometry(circle)
+            _, added = provider.addFeatures([feature])
+            if added:
+                self._search_area_fid = added[0].id()
         else:
-            # Clear all existing features
-            self.search_area_layer.dataProvider().truncate()
-            self.search_area_layer.updateExtents()
-        
-        # Add the new circle to the layer
-        feature = QgsFeature()
-        feature.setGeometry(wgs84_circle)
-        self.search_area_layer.dataProvider().addFeatures([feature])
-        
-        # Update layer extents and refresh
+            provider.changeGeometryValues({self._search_area_fid: circle})
+
+        # Update layer extents; triggerRepaint queues only this layer's
+        # re-render instead of refreshing the whole canvas
         self.search_area_layer.updateExtents()
         self.search_area_layer.triggerRepaint()
-        
-        # Update the map canvas
-        self.iface.mapCanvas().refresh()
-        
-        # Debug information
-        print(f"Search area created (WGS84-based, matching API):")
-        print(f"  Center WGS84: {wgs84_center.x():.6f}, {wgs84_center.y():.6f}")
-        print(f"  Radius: {radius_km} km (geodetic/spherical distance)")
-        print(f"  Display CRS: {project_crs.authid()}")
 
 
     def clear_center_point_layer(self):
@@ -499,59 +725,103 @@ class ChargeSpot:
         if self.center_point_layer:
             self.center_point_layer.dataProvider().truncate()
             self.center_point_layer.triggerRepaint()
+            self._center_fid = None
+            self._center_point_xy = None
 
     def preview_radius_update(self, point, radius_km):
         """Preview the search area without starting the search."""
-        # Create or clear the center point layer
+        # Duplicate emissions (slider echo, dialog round trip) would redo
+        # the whole transform + buffer for an identical circle
+        key = (round(point.x(), 6), round(point.y(), 6), radius_km)
+        if key == self._last_preview_key:
+            return
+        self._last_preview_key = key
+
+        # Create the center point layer once, then move its single
+        # feature in place on later previews
         if not self.center_point_layer:
             self.create_center_point_layer()
+
+        self._center_point_xy = QgsPointXY(point)
+        geometry = QgsGeometry.fromPointXY(point)
+        provider = self.center_point_layer.dataProvider()
+        if self._center_fid is None:
+            feature = QgsFeature()
+            feature.setGeometry(geometry)
+            _, added = provider.addFeatures([feature])
+            if added:
+                self._center_fid = added[0].id()
         else:
-            self.clear_center_point_layer()
-        
-        # Add the point to the layer
-        feature = QgsFeature()
-        feature.setGeometry(QgsGeometry.fromPointXY(point))
-        self.center_point_layer.dataProvider().addFeatures([feature])
+            provider.changeGeometryValues({self._center_fid: geometry})
         self.center_point_layer.triggerRepaint()
-        
-        # Update the search area preview
-        self.update_search_area(radius_km)
+
+        # Draw the preview circle on the canvas overlay; rubber bands
+        # repaint directly without touching a layer or the full canvas
+        circle = self._build_search_circle(point, radius_km)
+        self._get_preview_band().setToGeometry(circle, None)
     
+    def _on_dialog_radius_changed(self, radius_km):
+        """Relay radius changes from the dialog into the preview pipeline.
+
+        The map tool's slider already previews during a drag, so this only
+        redraws the committed search area, and not at all while we are the
+        ones pushing values into the dialog."""
+        if self._suspend_preview or radius_km == self._last_dialog_radius:
+            return
+        self._last_dialog_radius = radius_km
+        self.update_search_area(radius_km)
+
     def handle_radius_update(self, point, radius_km):
         """Handle search request from the map tool.
         Uses project CRS for display, converts to WGS84 only for API calls."""
         
         # Update dialog with search request
         if self.dlg:
-            # Update the search area first (using point in project CRS)
-            self.preview_radius_update(point, radius_km)
-            
+            # Show the marker, commit the final circle to the layer and
+            # drop the transient preview overlay; the marker is usually
+            # already in place from the drag previews
+            key = (round(point.x(), 6), round(point.y(), 6), radius_km)
+            if key != self._last_preview_key:
+                self.preview_radius_update(point, radius_km)
+            self.update_search_area(radius_km)
+            self._clear_preview_band()
+
             # Convert to WGS84 only for the API call
             project_crs = QgsProject.instance().crs()
-            wgs84_crs = QgsCoordinateReferenceSystem("EPSG:4326")
-            
+
             # Only transform if project CRS is not already WGS84
-            if project_crs.authid() != "EPSG:4326":
-                transform = QgsCoordinateTransform(project_crs, wgs84_crs, QgsProject.instance())
+            if self._needs_xform:
+                transform = self._get_transform(project_crs, self._wgs84_crs)
                 try:
                     wgs84_point = transform.transform(point)
                     api_x, api_y = wgs84_point.x(), wgs84_point.y()
-                    
-                    print(f"API coordinate conversion:")
-                    print(f"  Project CRS ({project_crs.authid()}): {point.x():.6f}, {point.y():.6f}")
-                    print(f"  API WGS84: {api_x:.6f}, {api_y:.6f}")
-                    
+
+                    if _DEBUG:
+                        QgsMessageLog.logMessage(
+                            f"API coordinates "
+                            f"({project_crs.authid()} -> WGS84): "
+                            f"{api_x:.6f}, {api_y:.6f}",
+                            "ChargeSpot", Qgis.Info
+                        )
                 except Exception as e:
-                    print(f"API coordinate transformation failed: {e}")
+                    QgsMessageLog.logMessage(
+                        f"API coordinate transformation failed: {e}",
+                        "ChargeSpot", Qgis.Warning
+                    )
                     api_x, api_y = point.x(), point.y()
             else:
                 # Already in WGS84
                 api_x, api_y = point.x(), point.y()
-                print(f"Project already in WGS84: {api_x:.6f}, {api_y:.6f}")
             
-            # Start the search using WGS84 coordinates for API
-            self.dlg.set_center_point(api_x, api_y, show_confirmation=False)
-            self.dlg.search_charging_stations(radius_km)
+            # Start the search using WGS84 coordinates for API; suspend
+            # previews so any radius echo from the dialog does not rerun
+            # the pipeline we just finished
+            self._suspend_preview = True
+            try:
+                self.dlg.set_center_point(api_x, api_y, show_confirmation=False)
+                self.dlg.search_charging_stations(radius_km)
+            finally:
+                self._suspend_preview = False
             
             # Deactivate the map tool after search
             self.iface.mapCanvas().unsetMapTool(self.map_tool)
@@ -561,10 +831,15 @@ class ChargeSpot:
 
         # Create the dialog if it doesn't exist
         if not self.dlg:
+            # Let layer jobs render concurrently so the targeted
+            # search-area repaints overlap with basemap rendering
+            self.iface.mapCanvas().setParallelRenderingEnabled(True)
             self.dlg = ChargeSpotDialog(self.iface, self.api_client)
             self.dlg.map_click_requested.connect(self.activate_map_tool)
             self.dlg.search_completed.connect(self.handle_search_results)
-            self.dlg.radius_changed.connect(self.update_search_area)
+            self.dlg.radius_changed.connect(
+                self._on_dialog_radius_changed, Qt.UniqueConnection
+            )
 
         # show the dialog
         self.dlg.show()
@@ -574,6 +849,7 @@ class ChargeSpot:
         # Deactivate map tool when dialog closes
         if self.map_tool:
             self.iface.mapCanvas().unsetMapTool(self.map_tool)
+        self._clear_preview_band()
 
     def activate_map_tool(self):
         """Activate the map tool for point selection."""
@@ -583,60 +859,105 @@ class ChargeSpot:
     def handle_search_results(self, charging_stations):
         """Handle the search results and create a layer."""
         if charging_stations:
-            # Create and add the charging stations layer
-            layer = self.dlg.create_charging_stations_layer(charging_stations)
-            if layer:
+            # Repeat search over identical results: reuse the existing
+            # layer and skip the feature/symbol rebuild entirely. The hash
+            # covers the coordinates plus all twelve layer attributes
+            # (everything the identify popup and status symbology read),
+            # so refreshed data after a cache expiry rebuilds even when
+            # ids and coordinates match.
+            results_hash = hash(tuple(
+                (s.get('id'), s.get('latitude'), s.get('longitude'),
+                 s.get('name'), s.get('address'), s.get('operator'),
+                 s.get('status'), s.get('access_type'), s.get('distance'),
+                 s.get('num_points'),
+                 tuple(s.get('connection_types') or ()),
+                 tuple(s.get('power_levels') or ()),
+                 s.get('phone'), s.get('url'))
+                for s in charging_stations
+            ))
+            station_count = len(charging_stations)
+            if results_hash == self._last_results_hash and self.current_layer is not None:
+                # The user may have deleted the layer from the legend, in
+                # which case the sip wrapper raises on any access; fall
+                # through to the rebuild path
+                try:
+                    layer_alive = QgsProject.instance().mapLayer(
+                        self.current_layer.id()) is not None
+                except RuntimeError:
+                    layer_alive = False
+                    self.current_layer = None
+                if layer_alive:
+                    self._present_search_results(station_count)
+                    return
+
+            def on_layer_ready(layer):
+                # Delivered on the main thread once the background
+                # feature build finishes
+                if layer is None:
+                    return
                 QgsProject.instance().addMapLayer(layer)
                 self.current_layer = layer
-                
+                self._last_results_hash = results_hash
+
                 # Setup identify tool for the new layer
                 self.setup_identify_tool(layer)
-                
-                # Get the search area layer extent
-                if self.search_area_layer and self.search_area_layer.featureCount() > 0:
-                    # Force update the search area layer extent
-                    self.search_area_layer.updateExtents()
-                    
-                    # Use search area extent for zooming
-                    extent = self.search_area_layer.extent()
-                    
-                    # Debug print to check if extent is being updated
-                    print(f"Search area extent: {extent.toString()}")
-                    
-                    # Add 20% padding
-                    width = extent.width()
-                    height = extent.height()
-                    padding_x = width * 0.1
-                    padding_y = height * 0.1
-                    
-                    extent.setXMinimum(extent.xMinimum() - padding_x)
-                    extent.setXMaximum(extent.xMaximum() + padding_x)
-                    extent.setYMinimum(extent.yMinimum() - padding_y)
-                    extent.setYMaximum(extent.yMaximum() + padding_y)
-                    
-                    # Set the map extent and refresh
-                    canvas = self.iface.mapCanvas()
-                    canvas.setExtent(extent)
-                    canvas.refresh()
-                
-                # Show success message with identify tool instructions
-                project_crs = QgsProject.instance().crs()
-                QMessageBox.information(
-                    self.dlg,
-                    "Success",
-                    f"Found and added {len(charging_stations)} charging stations to the map!\n\n"
-                    f"Using project CRS: {project_crs.authid()}\n\n"
-                    f"💡 Tip: Click on any charging station point to see detailed information!"
-                )
-                
-                # Automatically activate the identify tool
-                self.activate_identify_tool()
+                self._present_search_results(station_count)
+
+            self.dlg.create_charging_stations_layer(
+                charging_stations, on_layer_ready
+            )
         else:
             QMessageBox.warning(
                 self.dlg,
                 "No Results",
                 "No charging stations found in the specified area."
             )
+
+    def _present_search_results(self, station_count):
+        """Zoom to the search area and announce the finished result layer."""
+        # Get the search area layer extent
+        if self.search_area_layer and self.search_area_layer.featureCount() > 0:
+            # Force update the search area layer extent
+            self.search_area_layer.updateExtents()
+
+            # Use search area extent for zooming
+            extent = self.search_area_layer.extent()
+
+            if _DEBUG:
+                QgsMessageLog.logMessage(
+                    f"Search area extent: {extent.toString()}",
+                    "ChargeSpot",
+                    Qgis.Info
+                )
+
+            # Add 20% padding
+            width = extent.width()
+            height = extent.height()
+            padding_x = width * 0.1
+            padding_y = height * 0.1
+
+            extent.setXMinimum(extent.xMinimum() - padding_x)
+            extent.setXMaximum(extent.xMaximum() + padding_x)
+            extent.setYMinimum(extent.yMinimum() - padding_y)
+            extent.setYMaximum(extent.yMaximum() + padding_y)
+
+            # Set the map extent and refresh
+            canvas = self.iface.mapCanvas()
+            canvas.setExtent(extent)
+            canvas.refresh()
+
+        # Notify via the message bar; a blocking popup would stall
+        # interaction right after the async search returns
+        self.iface.messageBar().pushMessage(
+            "ChargeSpot",
+            f"Found and added {station_count} charging stations to the map. "
+            f"Click on any station point to see detailed information.",
+            level=Qgis.Success,
+            duration=5
+        )
+
+        # Automatically activate the identify tool
+        self.activate_identify_tool()
     
     def setup_identify_tool(self, layer):
         """Setup the identify tool for the charging stations layer."""
@@ -1,26 +1,190 @@
 import os
+import sys
 from qgis.PyQt import QtWidgets, uic
-from qgis.PyQt.QtCore import pyqtSignal, Qt, QTimer, pyqtSlot
-from qgis.PyQt.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, 
-                                QLabel, QLineEdit, QPushButton, QSpinBox, QListWidget, 
+from qgis.PyQt.QtCore import (pyqtSignal, Qt, QTimer, pyqtSlot,
+                              QAbstractTableModel, QModelIndex, QEvent,
+                              QObject, QRunnable, QThreadPool, QSignalBlocker)
+from qgis.PyQt.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
+                                QLabel, QLineEdit, QPushButton, QSpinBox, QListWidget,
                                 QListWidgetItem, QTabWidget, QWidget, QComboBox,
                                 QCheckBox, QProgressBar, QTextEdit, QGroupBox,
-                                QMessageBox, QFileDialog, QTableWidget, QTableWidgetItem,
+                                QMessageBox, QFileDialog, QTableView,
+                                QStyledItemDelegate, QStyleOptionButton, QStyle,
+                                QApplication,
                                 QHeaderView, QAbstractItemView, QSlider)
 from qgis.PyQt.QtGui import QIcon, QPixmap, QFont
-from qgis.core import (QgsVectorLayer, QgsFeature, QgsGeometry, QgsPointXY, 
+from qgis.core import (QgsVectorLayer, QgsFeature, QgsGeometry, QgsPointXY,
+                      QgsLineString,
                       QgsField, QgsProject, QgsSymbol, QgsRendererCategory,
                       QgsCategorizedSymbolRenderer, QgsMarkerSymbol, 
                       QgsSvgMarkerSymbolLayer, QgsSimpleMarkerSymbolLayer,
-                      QgsMessageLog, Qgis, QgsCoordinateReferenceSystem)
+                      QgsMessageLog, Qgis, QgsCoordinateReferenceSystem,
+                      QgsFeatureSink)
 from qgis.PyQt.QtCore import QVariant
 import json
 from datetime import datetime
-try:
-    from .pdf_export import PDFExporter
-    PDF_EXPORT_AVAILABLE = True
-except ImportError:
-    PDF_EXPORT_AVAILABLE = False
+from operator import itemgetter
+# Importing the module is cheap; reportlab itself is loaded lazily on
+# the first PDFExporter() construction
+from .pdf_export import PDFExporter
+from .api_client import ensure_transport
+
+# Fixed-order attribute extraction for the layer sink; processed stations
+# always carry every key (the joined list fields are stamped at ingest),
+# so one itemgetter call replaces a per-key .get ladder per feature
+_FEATURE_GETTER = itemgetter(
+    'id', 'name', 'address', 'operator', 'status', 'access_type',
+    'distance', 'num_points', '_conn_joined', '_power_joined',
+    'phone', 'url'
+)
+
+# Results table layout; the last column is the per-row Info action
+_RESULT_HEADERS = ("Name", "Distance (km)", "Address", "Operator",
+                   "Status", "Access Type", "Connections", "Actions")
+_RESULT_KEYS = ('name', 'distance', 'address', 'operator',
+                'status', 'access_type', 'connection_types')
+_ACTION_COLUMN = 7
+
+# Sort-combo label -> itemgetter over keys precomputed per result set
+_SORT_KEYS = {
+    "Distance": itemgetter('_distance_key'),
+    "Name": itemgetter('_name_lc'),
+    "Operator": itemgetter('_operator_lc'),
+    "Status": itemgetter('_status_lc'),
+    "Number of Points": itemgetter('num_points'),
+}
+
+
+class StationTableModel(QAbstractTableModel):
+    """Read-only model over the filtered station dicts.
+
+    The view only requests data() for visible cells, so swapping result
+    sets is O(1) instead of building a widget item per cell; display
+    strings (distance, connection summary) are precomputed at ingest."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_stations(self, stations):
+        """Swap the backing station list and refresh the view."""
+        self.beginResetModel()
+        self._rows = stations
+        self.endResetModel()
+
+    def station_at(self, row):
+        """Return the station dict behind a view row."""
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(_RESULT_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return _RESULT_HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        column = index.column()
+        if column == _ACTION_COLUMN:
+            return None  # drawn by the button delegate
+        station = self._rows[index.row()]
+        if column == 1:
+            return station.get('_distance_display', 'N/A')
+        if column == 6:
+            return station.get('_conn_display', '')
+        return station.get(_RESULT_KEYS[column], 'Unknown')
+
+
+class InfoButtonDelegate(QStyledItemDelegate):
+    """Draws the per-row Info button instead of allocating a widget.
+
+    A painted button costs nothing per row; the click is handled in
+    editorEvent and forwarded with the row's station dict."""
+
+    def __init__(self, info_callback, parent=None):
+        super().__init__(parent)
+        self.info_callback = info_callback
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(4, 2, -4, -2)
+        button.text = "Info"
+        button.state = QStyle.State_Enabled
+        QApplication.style().drawControl(
+            QStyle.CE_PushButton, button, painter
+        )
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton):
+            self.info_callback(model.station_at(index.row()))
+            return True
+        return False
+
+
+def _build_station_features(stations, transform):
+    """Build the feature list for the stations layer.
+
+    Pure-data construction (geometries and attribute lists), safe to run
+    off the UI thread; provider insertion stays on the main thread."""
+    # Transform all coordinates in one call by packing them into a
+    # single line geometry; per-station transform.transform() would
+    # cost a Python/C round trip per point
+    points = [
+        QgsPointXY(station['longitude'], station['latitude'])
+        for station in stations
+    ]
+    if transform:
+        try:
+            batch = QgsGeometry(QgsLineString(
+                [p.x() for p in points], [p.y() for p in points]
+            ))
+            batch.transform(transform)
+            points = batch.asPolyline()
+        except Exception:
+            # Fallback: keep original WGS84 coordinates
+            pass
+
+    features = []
+    for station, point in zip(stations, points):
+        feature = QgsFeature()
+        feature.setGeometry(QgsGeometry.fromPointXY(point))
+
+        feature.setAttributes(list(_FEATURE_GETTER(station)))
+
+        features.append(feature)
+    return features
+
+
+class FeatureBuildSignals(QObject):
+    """Signal holder for FeatureBuildWorker."""
+    finished = pyqtSignal(list)
+
+
+class FeatureBuildWorker(QRunnable):
+    """Builds station features on the thread pool.
+
+    Keeps the UI responsive while a large result set is converted into
+    QgsFeature objects; the finished list is handed back to the main
+    thread for the provider insert."""
+
+    def __init__(self, stations, transform):
+        super().__init__()
+        self.stations = stations
+        self.transform = transform
+        self.signals = FeatureBuildSignals()
+        self.setAutoDelete(False)
+
+    def run(self):
+        self.signals.finished.emit(
+            _build_station_features(self.stations, self.transform)
+        )
 
 
 class ChargeSpotDialog(QDialog):
@@ -29,18 +193,80 @@ class ChargeSpotDialog(QDialog):
     map_click_requested = pyqtSignal()
     search_completed = pyqtSignal(list)
     radius_changed = pyqtSignal(float)  # Signal for search radius changes
-    
+
+    # Layer schema and status symbology are constant; built once in
+    # __init__ instead of per search
+    _FIELD_SPEC = (
+        ('id', QVariant.Int),
+        ('name', QVariant.String),
+        ('address', QVariant.String),
+        ('operator', QVariant.String),
+        ('status', QVariant.String),
+        ('access_type', QVariant.String),
+        ('distance', QVariant.Double),
+        ('num_points', QVariant.Int),
+        ('connection_types', QVariant.String),
+        ('power_levels', QVariant.String),
+        ('phone', QVariant.String),
+        ('url', QVariant.String),
+    )
+    _STATUS_STYLES = {
+        'Operational': {'color': 'green', 'icon': 'circle'},
+        'Available': {'color': 'green', 'icon': 'circle'},
+        'Out of Service': {'color': 'red', 'icon': 'cross'},
+        'Unknown': {'color': 'orange', 'icon': 'circle'},
+        'Planned': {'color': 'blue', 'icon': 'triangle'},
+    }
+
     def __init__(self, iface, api_client):
         super(ChargeSpotDialog, self).__init__()
         self.iface = iface
         self.api_client = api_client
         self.current_stations = []
         self.filtered_stations = []
-        self.api_worker = None
-        if PDF_EXPORT_AVAILABLE:
-            self.pdf_exporter = PDFExporter()
-        else:
-            self.pdf_exporter = None
+        self.center_x = None
+        self.center_y = None
+        # Per-filter-type inverted index (value -> stations) and its
+        # sorted keys, rebuilt once per result set so both filtering
+        # and combo population are dict lookups
+        self._filter_index = {}
+        self._filter_values = {}
+        # Last applied (filter, value) and (sort, descending) states so
+        # no-change signal echoes skip the refilter/resort entirely
+        self._last_filter = None
+        self._last_sort = None
+        self._qgs_fields = [
+            QgsField(name, field_type) for name, field_type in self._FIELD_SPEC
+        ]
+        self._status_symbols = {
+            status: QgsMarkerSymbol.createSimple({
+                'name': style['icon'],
+                'color': style['color'],
+                'size': '8',
+                'outline_color': 'black',
+                'outline_width': '0.5'
+            })
+            for status, style in self._STATUS_STYLES.items()
+        }
+        self._default_symbol = QgsMarkerSymbol.createSimple({
+            'name': 'circle',
+            'color': 'gray',
+            'size': '8',
+            'outline_color': 'black',
+            'outline_width': '0.5'
+        })
+        # In-flight search workers; each runnable stays referenced until
+        # its signal lands, and the generation counter discards responses
+        # a newer search has superseded
+        self._api_workers = set()
+        self._search_gen = 0
+        # Created on first export so reportlab setup is not paid up front
+        self.pdf_exporter = None
+        # In-flight layer builds; each runnable stays referenced until its
+        # finished signal lands, and the generation counter lets a newer
+        # search invalidate results from a slower older build
+        self._layer_workers = set()
+        self._layer_build_gen = 0
         
         self.setupUi()
         self.connect_signals()
@@ -56,18 +282,16 @@ class ChargeSpotDialog(QDialog):
         # Create tab widget
         self.tab_widget = QTabWidget()
         
-        # Search tab
+        # Search tab is what opens first; the Results and Settings tabs
+        # hold placeholders until first shown so dialog-open cost stays
+        # proportional to what the user actually looks at
         search_tab = self._create_search_tab()
         self.tab_widget.addTab(search_tab, "Search")
-        
-        # Results tab
-        results_tab = self._create_results_tab()
-        self.tab_widget.addTab(results_tab, "Results")
-        
-        # Settings tab
-        settings_tab = self._create_settings_tab()
-        self.tab_widget.addTab(settings_tab, "Settings")
-        
+        self.tab_widget.addTab(QWidget(), "Results")
+        self.tab_widget.addTab(QWidget(), "Settings")
+        self._built_tabs = {0}
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
+
         main_layout.addWidget(self.tab_widget)
         
         # Status bar
@@ -80,7 +304,24 @@ class ChargeSpotDialog(QDialog):
         main_layout.addWidget(self.progress_bar)
         
         self.setLayout(main_layout)
-    
+
+    def _ensure_tab(self, index):
+        """Build the Results or Settings tab contents on first use."""
+        if index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        if index == 1:
+            factory, label = self._create_results_tab, "Results"
+        elif index == 2:
+            factory, label = self._create_settings_tab, "Settings"
+        else:
+            return
+        current = self.tab_widget.currentIndex()
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, factory(), label)
+        if current == index:
+            self.tab_widget.setCurrentIndex(index)
+
     def _create_search_tab(self):
         """Create the search tab."""
         widget = QWidget()
@@ -191,20 +432,24 @@ class ChargeSpotDialog(QDialog):
         
         layout.addLayout(filter_layout)
         
-        # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(8)
-        self.results_table.setHorizontalHeaderLabels([
-            "Name", "Distance (km)", "Address", "Operator", 
-            "Status", "Access Type", "Connections", "Actions"
-        ])
-        
-        # Configure table
+        # Results table: model/view so only visible rows are realized
+        self.results_model = StationTableModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        self.info_delegate = InfoButtonDelegate(
+            self.show_station_info, self.results_table
+        )
+        self.results_table.setItemDelegateForColumn(
+            _ACTION_COLUMN, self.info_delegate
+        )
+
+        # Configure table; fixed widths instead of ResizeToContents,
+        # which would stringify every row just to measure columns
         header = self.results_table.horizontalHeader()
         header.setStretchLastSection(True)
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.Stretch)
+        self.results_table.setColumnWidth(0, 180)
+        self.results_table.setColumnWidth(1, 90)
         
         self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.results_table.setAlternatingRowColors(True)
@@ -227,10 +472,23 @@ class ChargeSpotDialog(QDialog):
         export_layout.addWidget(self.export_pdf_btn)
         
         layout.addLayout(export_layout)
-        
+
         widget.setLayout(layout)
+
+        # These widgets are created lazily, so their signal hookups
+        # live here rather than in connect_signals
+        self.filter_combo.currentTextChanged.connect(self.update_filter_values)
+        self.filter_value_combo.currentTextChanged.connect(self.apply_filters)
+        self.sort_combo.currentTextChanged.connect(self.apply_filters)
+        self.sort_desc_check.toggled.connect(self.apply_filters)
+        self.select_all_btn.clicked.connect(self.select_all_results)
+        self.clear_selection_btn.clicked.connect(self.clear_result_selection)
+        self.export_pdf_btn.clicked.connect(self.export_to_pdf)
+        self.results_table.selectionModel().selectionChanged.connect(
+            self.update_export_button
+        )
         return widget
-    
+
     def _create_settings_tab(self):
         """Create the settings tab."""
         widget = QWidget()
@@ -281,22 +539,16 @@ class ChargeSpotDialog(QDialog):
         return widget
     
     def connect_signals(self):
-        """Connect UI signals to handlers."""
+        """Connect UI signals to handlers.
+
+        Results-tab signals are wired in _create_results_tab since those
+        widgets are built lazily."""
         self.search_btn.clicked.connect(self.search_charging_stations)
-        self.filter_combo.currentTextChanged.connect(self.update_filter_values)
-        self.filter_value_combo.currentTextChanged.connect(self.apply_filters)
-        self.sort_combo.currentTextChanged.connect(self.apply_filters)
-        self.sort_desc_check.toggled.connect(self.apply_filters)
-        self.select_all_btn.clicked.connect(self.select_all_results)
-        self.clear_selection_btn.clicked.connect(self.clear_result_selection)
-        self.export_pdf_btn.clicked.connect(self.export_to_pdf)
-        self.results_table.itemSelectionChanged.connect(self.update_export_button)
-        
 
-        
+
     def get_center_point(self):
         """Get the current center point coordinates."""
-        if hasattr(self, 'center_x') and hasattr(self, 'center_y'):
+        if self.center_x is not None and self.center_y is not None:
             return self.center_x, self.center_y
         return None
     
@@ -347,7 +599,7 @@ class ChargeSpotDialog(QDialog):
     
     def search_charging_stations(self, radius_km=None):
         """Search for charging stations."""
-        if not hasattr(self, 'center_x') or not hasattr(self, 'center_y'):
+        if self.center_x is None or self.center_y is None:
             QMessageBox.warning(
                 self,
                 "Missing Center Point",
@@ -355,6 +607,13 @@ class ChargeSpotDialog(QDialog):
             )
             return
         
+        # Any dependency install prompt has to happen here on the GUI
+        # thread; the worker itself fails fast instead of prompting
+        if not ensure_transport():
+            self.status_label.setText(
+                "Search unavailable: requests library not installed")
+            return
+
         # Start search
         self.search_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
@@ -367,17 +626,37 @@ class ChargeSpotDialog(QDialog):
         # Use provided radius or default to 10 km
         search_radius = radius_km if radius_km is not None else 10
         
+        # Tag the search; a newer one bumps the counter so a slow stale
+        # response landing afterwards is discarded instead of applied
+        self._search_gen += 1
+        generation = self._search_gen
+
         # Start async API call
-        self.api_worker = self.api_client.get_async(
+        worker = self.api_client.get_async(
             self.center_y,  # latitude
             self.center_x,  # longitude
             search_radius,
             api_key
         )
-        
-        self.api_worker.finished.connect(self.handle_api_response)
-        self.api_worker.error.connect(self.handle_api_error)
-        self.api_worker.start()
+
+        def on_finished(stations):
+            self._api_workers.discard(worker)
+            if generation != self._search_gen:
+                return
+            self.handle_api_response(stations)
+
+        def on_error(error_message):
+            self._api_workers.discard(worker)
+            if generation != self._search_gen:
+                return
+            self.handle_api_error(error_message)
+
+        worker.finished.connect(on_finished)
+        worker.error.connect(on_error)
+        # Keep every in-flight runnable referenced so the pool never owns
+        # a wrapper Python has collected
+        self._api_workers.add(worker)
+        worker.start()
     
     def handle_api_response(self, stations):
         """Handle successful API response."""
@@ -395,12 +674,20 @@ class ChargeSpotDialog(QDialog):
             
         self.status_label.setText(f"Found {len(stations)} charging stations")
         
+        # Results widgets must exist before they are populated
+        self._ensure_tab(1)
+
         self.current_stations = stations
-        self.filtered_stations = stations.copy()
-        
+        # Alias until a filter/sort replaces it; the model never mutates
+        self.filtered_stations = stations
+        self._rebuild_filter_values()
+        # New result set: force the next filter/sort change to re-apply
+        self._last_filter = None
+        self._last_sort = None
+
         # Update results table
-        self.populate_results_table()
-        
+        self.results_model.set_stations(self.filtered_stations)
+
         # Update filter options
         self.update_all_filter_values()
         
@@ -422,71 +709,89 @@ class ChargeSpotDialog(QDialog):
             f"Failed to fetch charging stations:\n\n{error_message}"
         )
     
-    def populate_results_table(self):
-        """Populate the results table with filtered stations."""
-        self.results_table.setRowCount(len(self.filtered_stations))
-        
-        for row, station in enumerate(self.filtered_stations):
-            # Name
-            self.results_table.setItem(row, 0, QTableWidgetItem(station.get('name', 'Unknown')))
-            
-            # Distance
-            distance = station.get('distance')
-            distance_text = f"{distance:.2f}" if distance is not None else "N/A"
-            self.results_table.setItem(row, 1, QTableWidgetItem(distance_text))
-            
-            # Address
-            self.results_table.setItem(row, 2, QTableWidgetItem(station.get('address', 'Unknown')))
-            
-            # Operator
-            self.results_table.setItem(row, 3, QTableWidgetItem(station.get('operator', 'Unknown')))
-            
-            # Status
-            self.results_table.setItem(row, 4, QTableWidgetItem(station.get('status', 'Unknown')))
-            
-            # Access Type
-            self.results_table.setItem(row, 5, QTableWidgetItem(station.get('access_type', 'Unknown')))
-            
-            # Connections
-            conn_types = station.get('connection_types', [])
-            conn_text = ', '.join(conn_types[:3])  # Show first 3 types
-            if len(conn_types) > 3:
-                conn_text += "..."
-            self.results_table.setItem(row, 6, QTableWidgetItem(conn_text))
-            
-            # Actions - Info button
-            info_btn = QPushButton("Info")
-            info_btn.clicked.connect(lambda checked, s=station: self.show_station_info(s))
-            self.results_table.setCellWidget(row, 7, info_btn)
-    
     def show_station_info(self, station):
         """Show detailed station information."""
         info_dialog = StationInfoDialog(station, self)
         info_dialog.exec_()
     
+    def _rebuild_filter_values(self):
+        """Index the results by filter value in one pass.
+
+        Each filter type maps value -> station list, so applying a
+        filter is a dict lookup; the sorted keys double as the combo
+        contents."""
+        access_types = {}
+        operators = {}
+        statuses = {}
+        connection_types = {}
+        power_levels = {}
+        for station in self.current_stations:
+            # Intern the low-cardinality fields; filter compares and the
+            # categorized renderer then match on identity, and the few
+            # distinct values share storage
+            station['status'] = sys.intern(station.get('status') or 'Unknown')
+            station['operator'] = sys.intern(
+                station.get('operator') or 'Unknown')
+            station['access_type'] = sys.intern(
+                station.get('access_type') or 'Unknown')
+            # Sort keys are precomputed here so re-sorts never repeat
+            # the .get()/.lower() work per station
+            station['_name_lc'] = station.get('name', '').lower()
+            station['_operator_lc'] = station.get('operator', '').lower()
+            station['_status_lc'] = station.get('status', '').lower()
+            distance = station.get('distance')
+            station['_distance_key'] = (
+                distance if distance is not None else float('inf')
+            )
+            # Display strings the table re-reads on every repaint
+            station['_distance_display'] = (
+                f"{distance:.2f}" if distance is not None else "N/A"
+            )
+            conn_types = station.get('connection_types', ())
+            conn_text = ', '.join(conn_types[:3])  # Show first 3 types
+            if len(conn_types) > 3:
+                conn_text += "..."
+            station['_conn_display'] = conn_text
+            # Full joined lists, consumed by the layer attribute getter
+            station['_conn_joined'] = ', '.join(conn_types)
+            station['_power_joined'] = ', '.join(
+                station.get('power_levels', ()))
+            access_types.setdefault(
+                station.get('access_type', 'Unknown'), []).append(station)
+            operators.setdefault(
+                station.get('operator', 'Unknown'), []).append(station)
+            statuses.setdefault(
+                station.get('status', 'Unknown'), []).append(station)
+            for conn_type in station.get('connection_types', ()):
+                connection_types.setdefault(conn_type, []).append(station)
+            for power_level in station.get('power_levels', ()):
+                power_levels.setdefault(power_level, []).append(station)
+
+        self._filter_index = {
+            "Access Type": access_types,
+            "Operator": operators,
+            "Status": statuses,
+            "Connection Type": connection_types,
+            "Power Level": power_levels,
+        }
+        self._filter_values = {
+            filter_type: sorted(index)
+            for filter_type, index in self._filter_index.items()
+        }
+
     def update_filter_values(self):
         """Update filter value combo based on selected filter type."""
         filter_type = self.filter_combo.currentText()
-        self.filter_value_combo.clear()
-        
-        if filter_type == "All" or not self.current_stations:
-            return
-        
-        # Get unique values for the selected filter type
-        values = set()
-        for station in self.current_stations:
-            if filter_type == "Access Type":
-                values.add(station.get('access_type', 'Unknown'))
-            elif filter_type == "Operator":
-                values.add(station.get('operator', 'Unknown'))
-            elif filter_type == "Status":
-                values.add(station.get('status', 'Unknown'))
-            elif filter_type == "Connection Type":
-                values.update(station.get('connection_types', []))
-            elif filter_type == "Power Level":
-                values.update(station.get('power_levels', []))
-        
-        self.filter_value_combo.addItems(sorted(values))
+
+        # clear() and addItems() each emit currentTextChanged, which
+        # would re-run apply_filters per mutation; block and refilter once
+        with QSignalBlocker(self.filter_value_combo):
+            self.filter_value_combo.clear()
+            # Values are precomputed per result set; "All" has no entry
+            self.filter_value_combo.addItems(
+                self._filter_values.get(filter_type, [])
+            )
+        self.apply_filters()
     
     def update_all_filter_values(self):
         """Update all filter values when new data is loaded."""
@@ -501,96 +806,106 @@ class ChargeSpotDialog(QDialog):
         # Apply filter
         filter_type = self.filter_combo.currentText()
         filter_value = self.filter_value_combo.currentText()
-        
-        if filter_type == "All" or not filter_value:
-            self.filtered_stations = self.current_stations.copy()
-        else:
-            self.filtered_stations = []
-            for station in self.current_stations:
-                if self._station_matches_filter(station, filter_type, filter_value):
-                    self.filtered_stations.append(station)
-        
-        # Apply sorting
         sort_by = self.sort_combo.currentText()
         reverse = self.sort_desc_check.isChecked()
-        
-        if sort_by == "Distance":
-            self.filtered_stations.sort(
-                key=lambda s: s.get('distance', float('inf')), 
-                reverse=reverse
-            )
-        elif sort_by == "Name":
-            self.filtered_stations.sort(
-                key=lambda s: s.get('name', '').lower(), 
-                reverse=reverse
-            )
-        elif sort_by == "Operator":
-            self.filtered_stations.sort(
-                key=lambda s: s.get('operator', '').lower(), 
-                reverse=reverse
-            )
-        elif sort_by == "Status":
-            self.filtered_stations.sort(
-                key=lambda s: s.get('status', '').lower(), 
-                reverse=reverse
-            )
-        elif sort_by == "Number of Points":
-            self.filtered_stations.sort(
-                key=lambda s: s.get('num_points', 0), 
-                reverse=reverse
+
+        # Echoed signals with nothing changed are common (combo churn,
+        # checkbox repaints); bail before any list work
+        filter_state = (filter_type, filter_value)
+        sort_state = (sort_by, reverse)
+        if (filter_state == self._last_filter
+                and sort_state == self._last_sort):
+            return
+
+        if filter_state != self._last_filter:
+            if filter_type == "All" or not filter_value:
+                # Sorting below replaces the list wholesale, so aliasing
+                # is safe and skips an O(N) copy per combo keystroke
+                self.filtered_stations = self.current_stations
+            else:
+                # Inverted index lookup; sorting below builds a fresh
+                # list, so the bucket itself is never reordered
+                index = self._filter_index.get(filter_type, {})
+                self.filtered_stations = index.get(filter_value, [])
+        # else: same subset, only the order changed — resort in place
+
+        sort_key = _SORT_KEYS.get(sort_by)
+        if sort_key is not None:
+            # sorted() builds the new list, keeping current_stations and
+            # the index buckets untouched when filtered is an alias
+            self.filtered_stations = sorted(
+                self.filtered_stations, key=sort_key, reverse=reverse
             )
-        
+
+        self._last_filter = filter_state
+        self._last_sort = sort_state
+
         # Update table
-        self.populate_results_table()
-        
+        self.results_model.set_stations(self.filtered_stations)
+
         # Update status
         self.status_label.setText(
             f"Showing {len(self.filtered_stations)} of {len(self.current_stations)} stations"
         )
     
-    def _station_matches_filter(self, station, filter_type, filter_value):
-        """Check if station matches the current filter."""
-        if filter_type == "Access Type":
-            return station.get('access_type', 'Unknown') == filter_value
-        elif filter_type == "Operator":
-            return station.get('operator', 'Unknown') == filter_value
-        elif filter_type == "Status":
-            return station.get('status', 'Unknown') == filter_value
-        elif filter_type == "Connection Type":
-            return filter_value in station.get('connection_types', [])
-        elif filter_type == "Power Level":
-            return filter_value in station.get('power_levels', [])
-        return True
-    
     def select_all_results(self):
         """Select all results in the table."""
-        self.results_table.selectAll()
-    
+        with QSignalBlocker(self.results_table.selectionModel()):
+            self.results_table.selectAll()
+        self.update_export_button()
+
     def clear_result_selection(self):
         """Clear selection in results table."""
-        self.results_table.clearSelection()
+        with QSignalBlocker(self.results_table.selectionModel()):
+            self.results_table.clearSelection()
+        self.update_export_button()
     
-    def update_export_button(self):
+    def update_export_button(self, selected=None, deselected=None):
         """Update export button state based on selection."""
-        has_selection = len(self.results_table.selectedItems()) > 0
+        has_selection = self.results_table.selectionModel().hasSelection()
         self.export_pdf_btn.setEnabled(has_selection)
     
+    def _ensure_pdf_exporter(self):
+        """Create the PDF exporter on demand, installing reportlab if needed."""
+        if self.pdf_exporter is not None:
+            return True
+
+        try:
+            self.pdf_exporter = PDFExporter()
+            return True
+        except ImportError:
+            pass
+
+        try:
+            from .dependency_installer import install_dependencies
+            if not install_dependencies(['reportlab']):
+                return False
+            # Re-import so the failed lazy-import state is forgotten
+            import importlib
+            from . import pdf_export
+            importlib.reload(pdf_export)
+            self.pdf_exporter = pdf_export.PDFExporter()
+            return True
+        except Exception:
+            return False
+
     def export_to_pdf(self):
         """Export selected stations to PDF."""
-        if not PDF_EXPORT_AVAILABLE or self.pdf_exporter is None:
+        if not self._ensure_pdf_exporter():
             QMessageBox.warning(
-                self, 
-                "PDF Export Unavailable", 
+                self,
+                "PDF Export Unavailable",
                 "PDF export functionality is not available.\n"
                 "Please install the required dependency:\n"
                 "pip install reportlab"
             )
             return
-            
-        selected_rows = set()
-        for item in self.results_table.selectedItems():
-            selected_rows.add(item.row())
-        
+
+        selected_rows = {
+            index.row()
+            for index in self.results_table.selectionModel().selectedRows()
+        }
+
         if not selected_rows:
             QMessageBox.warning(self, "No Selection", "Please select stations to export.")
             return
@@ -621,43 +936,38 @@ class ChargeSpotDialog(QDialog):
                     f"Failed to export PDF:\n{str(e)}"
                 )
     
-    def create_charging_stations_layer(self, stations):
-        """Create a vector layer with charging stations."""
+    def create_charging_stations_layer(self, stations, on_ready):
+        """Create a vector layer with charging stations.
+
+        Feature construction runs on the thread pool so a large result
+        set does not stall the UI; the finished layer is delivered to
+        on_ready(layer) on the main thread (None if there is nothing to
+        build)."""
         if not stations:
-            return None
-        
+            on_ready(None)
+            return
+
+        # Layer options live on the lazily built Settings tab
+        self._ensure_tab(2)
+
         # Remove existing layer if requested
         layer_name = self.layer_name_edit.text() or "Charging Stations"
         if self.remove_existing_check.isChecked():
             layers = QgsProject.instance().mapLayersByName(layer_name)
             for layer in layers:
                 QgsProject.instance().removeMapLayer(layer.id())
-        
+
         # Get the project CRS
         project_crs = QgsProject.instance().crs()
-        
+
         # Create vector layer using project CRS
         layer = QgsVectorLayer(f'Point?crs={project_crs.authid()}', layer_name, 'memory')
         provider = layer.dataProvider()
-        
+
         # Add fields
-        fields = [
-            QgsField('id', QVariant.Int),
-            QgsField('name', QVariant.String),
-            QgsField('address', QVariant.String),
-            QgsField('operator', QVariant.String),
-            QgsField('status', QVariant.String),
-            QgsField('access_type', QVariant.String),
-            QgsField('distance', QVariant.Double),
-            QgsField('num_points', QVariant.Int),
-            QgsField('connection_types', QVariant.String),
-            QgsField('power_levels', QVariant.String),
-            QgsField('phone', QVariant.String),
-            QgsField('url', QVariant.String),
-        ]
-        provider.addAttributes(fields)
+        provider.addAttributes(self._qgs_fields)
         layer.updateFields()
-        
+
         # Set up coordinate transformation from WGS84 to project CRS
         wgs84_crs = QgsCoordinateReferenceSystem("EPSG:4326")
         if project_crs != wgs84_crs:
@@ -665,97 +975,108 @@ class ChargeSpotDialog(QDialog):
             transform = QgsCoordinateTransform(wgs84_crs, project_crs, QgsProject.instance())
         else:
             transform = None
-        
-        # Add features
-        features = []
-        for station in stations:
-            feature = QgsFeature()
-            
-            # Create point in WGS84
-            wgs84_point = QgsPointXY(station['longitude'], station['latitude'])
-            
-            # Transform to project CRS if needed
-            if transform:
-                try:
-                    transformed_point = transform.transform(wgs84_point)
-                    feature.setGeometry(QgsGeometry.fromPointXY(transformed_point))
-                except Exception as e:
-                    # Fallback: use original coordinates
-                    feature.setGeometry(QgsGeometry.fromPointXY(wgs84_point))
-            else:
-                feature.setGeometry(QgsGeometry.fromPointXY(wgs84_point))
-            
-            feature.setAttributes([
-                station.get('id'),
-                station.get('name', 'Unknown'),
-                station.get('address', 'Unknown'),
-                station.get('operator', 'Unknown'),
-                station.get('status', 'Unknown'),
-                station.get('access_type', 'Unknown'),
-                station.get('distance'),
-                station.get('num_points', 0),
-                ', '.join(station.get('connection_types', [])),
-                ', '.join(station.get('power_levels', [])),
-                station.get('phone', ''),
-                station.get('url', ''),
-            ])
-            
-            features.append(feature)
-        
-        provider.addFeatures(features)
-        layer.updateExtents()
-        
-        # Apply symbology
-        self._apply_layer_symbology(layer)
-        
-        return layer
+
+        # Tag this build; an overlapping newer search bumps the counter
+        # and this build's result is discarded when it lands
+        self._layer_build_gen += 1
+        generation = self._layer_build_gen
+
+        worker = FeatureBuildWorker(list(stations), transform)
+
+        def finish(features):
+            # Back on the main thread: providers are not thread-safe,
+            # so the batched insert and symbology happen here
+            self._layer_workers.discard(worker)
+            if generation != self._layer_build_gen:
+                # A newer search superseded this build while it ran
+                return
+            provider.addFeatures(features, QgsFeatureSink.FastInsert)
+            # Spatial index keeps identify-tool clicks O(log N) once
+            # results grow past a few hundred stations
+            provider.createSpatialIndex()
+            layer.updateExtents()
+            self._apply_layer_symbology(layer)
+            on_ready(layer)
+
+        worker.signals.finished.connect(finish)
+        # Keep every in-flight runnable referenced so the pool never owns
+        # a wrapper Python has collected
+        self._layer_workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
     
     def _apply_layer_symbology(self, layer):
         """Apply custom symbology to the charging stations layer."""
-        # Create categories based on status
-        categories = []
-        
-        # Define colors and icons for different statuses
-        status_styles = {
-            'Operational': {'color': 'green', 'icon': 'circle'},
-            'Available': {'color': 'green', 'icon': 'circle'},
-            'Out of Service': {'color': 'red', 'icon': 'cross'},
-            'Unknown': {'color': 'orange', 'icon': 'circle'},
-            'Planned': {'color': 'blue', 'icon': 'triangle'},
-        }
-        
-        for status, style in status_styles.items():
-            symbol = QgsMarkerSymbol.createSimple({
-                'name': style['icon'],
-                'color': style['color'],
-                'size': '8',
-                'outline_color': 'black',
-                'outline_width': '0.5'
-            })
-            
-            category = QgsRendererCategory(status, symbol, status)
-            categories.append(category)
-        
-        # Default category for other statuses
-        default_symbol = QgsMarkerSymbol.createSimple({
-            'name': 'circle',
-            'color': 'gray',
-            'size': '8',
-            'outline_color': 'black',
-            'outline_width': '0.5'
-        })
-        default_category = QgsRendererCategory('', default_symbol, 'Other')
-        categories.append(default_category)
-        
+        # Categories from the prebuilt status symbols; cloned because
+        # the renderer takes ownership of its symbol instances
+        categories = [
+            QgsRendererCategory(status, symbol.clone(), status)
+            for status, symbol in self._status_symbols.items()
+        ]
+        categories.append(
+            QgsRendererCategory('', self._default_symbol.clone(), 'Other')
+        )
+
         # Apply renderer
         renderer = QgsCategorizedSymbolRenderer('status', categories)
         layer.setRenderer(renderer)
         layer.triggerRepaint()
 
 
+# Station info page skeleton, parsed once at import; rendering is a
+# single format_map walk over the station dict
+_INFO_TEMPLATE = """
+<h2>{name}</h2>
+
+<h3>Location</h3>
+<p><strong>Address:</strong> {address}</p>
+<p><strong>Coordinates:</strong> {latitude}, {longitude}</p>
+<p><strong>Distance:</strong> {distance} km</p>
+
+<h3>General Information</h3>
+<p><strong>Operator:</strong> {operator}</p>
+<p><strong>Status:</strong> {status}</p>
+<p><strong>Access Type:</strong> {access_type}</p>
+<p><strong>Number of Charging Points:</strong> {num_points}</p>
+
+<h3>Connection Information</h3>
+<p><strong>Connection Types:</strong> {connection_types_joined}</p>
+<p><strong>Power Levels:</strong> {power_levels_joined}</p>
+
+<h3>Contact Information</h3>
+<p><strong>Phone:</strong> {phone}</p>
+<p><strong>Email:</strong> {email}</p>
+<p><strong>Website:</strong> {url}</p>
+
+<h3>Additional Information</h3>
+<p><strong>Cost:</strong> {cost}</p>
+<p><strong>Comments:</strong> {comments}</p>
+<p><strong>Date Created:</strong> {date_created}</p>
+<p><strong>Last Verified:</strong> {date_last_verified}</p>
+"""
+
+_CONN_TEMPLATE = """
+<h4>Connection {index}</h4>
+<ul>
+<li><strong>Type:</strong> {type}</li>
+<li><strong>Level:</strong> {level}</li>
+<li><strong>Power:</strong> {power_kw} kW</li>
+<li><strong>Current Type:</strong> {current_type}</li>
+<li><strong>Quantity:</strong> {quantity}</li>
+<li><strong>Status:</strong> {status}</li>
+</ul>
+"""
+
+
+class _UnknownDict(dict):
+    """Dict view that renders missing template keys as 'Unknown'."""
+
+    def __missing__(self, key):
+        return 'Unknown'
+
+
 class StationInfoDialog(QDialog):
     """Dialog to show detailed station information."""
-    
+
     def __init__(self, station, parent=None):
         super().__init__(parent)
         self.station = station
@@ -787,53 +1108,34 @@ class StationInfoDialog(QDialog):
     def _build_info_content(self):
         """Build HTML content for station information."""
         station = self.station
-        
-        html = f"""
-        <h2>{station.get('name', 'Unknown Station')}</h2>
-        
-        <h3>Location</h3>
-        <p><strong>Address:</strong> {station.get('address', 'Unknown')}</p>
-        <p><strong>Coordinates:</strong> {station.get('latitude', 'N/A')}, {station.get('longitude', 'N/A')}</p>
-        <p><strong>Distance:</strong> {station.get('distance', 'N/A')} km</p>
-        
-        <h3>General Information</h3>
-        <p><strong>Operator:</strong> {station.get('operator', 'Unknown')}</p>
-        <p><strong>Status:</strong> {station.get('status', 'Unknown')}</p>
-        <p><strong>Access Type:</strong> {station.get('access_type', 'Unknown')}</p>
-        <p><strong>Number of Charging Points:</strong> {station.get('num_points', 0)}</p>
-        
-        <h3>Connection Information</h3>
-        <p><strong>Connection Types:</strong> {', '.join(station.get('connection_types', ['Unknown']))}</p>
-        <p><strong>Power Levels:</strong> {', '.join(station.get('power_levels', ['Unknown']))}</p>
-        
-        <h3>Contact Information</h3>
-        <p><strong>Phone:</strong> {station.get('phone', 'Not available')}</p>
-        <p><strong>Email:</strong> {station.get('email', 'Not available')}</p>
-        <p><strong>Website:</strong> {station.get('url', 'Not available')}</p>
-        
-        <h3>Additional Information</h3>
-        <p><strong>Cost:</strong> {station.get('cost', 'Unknown')}</p>
-        <p><strong>Comments:</strong> {station.get('comments', 'None')}</p>
-        <p><strong>Date Created:</strong> {station.get('date_created', 'Unknown')}</p>
-        <p><strong>Last Verified:</strong> {station.get('date_last_verified', 'Unknown')}</p>
-        """
-        
+        # The rendered HTML is memoized on the dict itself, so re-opens of
+        # the same result reuse the string while different sources for the
+        # same station (identify tool vs. results table) never collide and
+        # the cache dies with the result set
+        cached = station.get('_info_html')
+        if cached is not None:
+            return cached
+
+        # One template walk instead of interleaving literals with
+        # twenty .get() calls; list fields are pre-joined
+        view = _UnknownDict(station)
+        view['connection_types_joined'] = ', '.join(
+            station.get('connection_types') or ['Unknown'])
+        view['power_levels_joined'] = ', '.join(
+            station.get('power_levels') or ['Unknown'])
+        html = _INFO_TEMPLATE.format_map(view)
+
         # Add detailed connection information if available
         connections = station.get('connections', [])
         if connections:
             html += "<h3>Detailed Connection Information</h3>"
-            for i, conn in enumerate(connections, 1):
-                html += f"""
-                <h4>Connection {i}</h4>
-                <ul>
-                <li><strong>Type:</strong> {conn.get('type', 'Unknown')}</li>
-                <li><strong>Level:</strong> {conn.get('level', 'Unknown')}</li>
-                <li><strong>Power:</strong> {conn.get('power_kw', 'Unknown')} kW</li>
-                <li><strong>Current Type:</strong> {conn.get('current_type', 'Unknown')}</li>
-                <li><strong>Quantity:</strong> {conn.get('quantity', 1)}</li>
-                <li><strong>Status:</strong> {conn.get('status', 'Unknown')}</li>
-                </ul>
-                """
-        
+            html += ''.join(
+                _CONN_TEMPLATE.format_map(
+                    _UnknownDict(conn, index=i)
+                )
+                for i, conn in enumerate(connections, 1)
+            )
+
+        station['_info_html'] = html
         return html
 
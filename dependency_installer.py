@@ -1,23 +1,36 @@
 import os
 import sys
 import subprocess
+import shutil
+import importlib.util
 from qgis.PyQt.QtWidgets import QMessageBox
 from qgis.core import QgsMessageLog, Qgis
 
 
-def install_dependencies():
-    """Install required dependencies for the plugin."""
-    
-    dependencies = ['requests', 'reportlab']
-    missing_deps = []
-    
-    # Check which dependencies are missing
-    for dep in dependencies:
-        try:
-            __import__(dep)
-        except ImportError:
-            missing_deps.append(dep)
-    
+ALL_DEPENDENCIES = ['requests', 'reportlab', 'orjson', 'ijson', 'httpx']
+
+# Pip targets that differ from the importable module name
+PIP_NAMES = {'httpx': 'httpx[http2]'}
+
+# Memoized result of check_dependencies(); None until the first check
+_deps_ok = None
+
+
+def install_dependencies(dependencies=None):
+    """Install required dependencies for the plugin.
+
+    Args:
+        dependencies: Optional subset of packages to check/install; defaults
+            to everything the plugin can use. Already-importable packages
+            are skipped, so calling this repeatedly is cheap.
+    """
+
+    if dependencies is None:
+        dependencies = ALL_DEPENDENCIES
+    # A spec lookup answers "is it installed?" without running module code
+    missing_deps = [dep for dep in dependencies
+                    if importlib.util.find_spec(dep) is None]
+
     if not missing_deps:
         return True
     
@@ -58,51 +71,57 @@ def install_dependencies():
         if libs_dir not in sys.path:
             sys.path.insert(0, libs_dir)
         
-        # Install each dependency
-        for dep in missing_deps:
-            QgsMessageLog.logMessage(
-                f"Installing {dep}...",
-                "ChargeSpot",
-                Qgis.Info
+        # Probe for a working pip once instead of letting every install
+        # attempt walk a list of commands that may not exist
+        if importlib.util.find_spec('pip') is not None:
+            pip_base = [sys.executable, "-m", "pip"]
+        else:
+            pip_bin = shutil.which('pip') or shutil.which('pip3')
+            if pip_bin is None:
+                raise Exception("No pip executable found")
+            pip_base = [pip_bin]
+
+        # One pip run for all packages: a single resolver and pip startup
+        # gets the batching win, and concurrent pip processes writing the
+        # same --target dir would race on shared transitive deps
+        QgsMessageLog.logMessage(
+            f"Installing {', '.join(missing_deps)}...",
+            "ChargeSpot",
+            Qgis.Info
+        )
+
+        pip_targets = [PIP_NAMES.get(dep, dep) for dep in missing_deps]
+        cmd = pip_base + ["install", "--target", libs_dir] + pip_targets
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=300  # 5 minutes timeout
             )
-            
-            # Try different pip commands
-            pip_commands = [
-                [sys.executable, "-m", "pip", "install", "--target", libs_dir, dep],
-                ["pip", "install", "--target", libs_dir, dep],
-                ["pip3", "install", "--target", libs_dir, dep]
-            ]
-            
-            success = False
-            for cmd in pip_commands:
-                try:
-                    result = subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=300  # 5 minutes timeout
-                    )
-                    if result.returncode == 0:
-                        success = True
-                        QgsMessageLog.logMessage(
-                            f"Successfully installed {dep}",
-                            "ChargeSpot",
-                            Qgis.Info
-                        )
-                        break
-                except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                    continue
-            
-            if not success:
-                raise Exception(f"Failed to install {dep}")
+        except (subprocess.TimeoutExpired, OSError):
+            raise Exception(f"Failed to install {', '.join(missing_deps)}")
+        if result.returncode != 0:
+            raise Exception(f"Failed to install {', '.join(missing_deps)}")
+
+        QgsMessageLog.logMessage(
+            f"Successfully installed {', '.join(missing_deps)}",
+            "ChargeSpot",
+            Qgis.Info
+        )
         
-        # Verify installation
+        # Verify installation; the finder caches predate the new files in
+        # libs_dir, so drop them before the real imports
+        importlib.invalidate_caches()
         for dep in missing_deps:
             try:
                 __import__(dep)
             except ImportError:
                 raise Exception(f"Failed to import {dep} after installation")
-        
+
+        global _deps_ok
+        _deps_ok = True
+
         QMessageBox.information(
             None,
             "Installation Complete",
@@ -136,13 +155,18 @@ def install_dependencies():
 
 
 def check_dependencies():
-    """Check if all dependencies are available."""
-    dependencies = ['requests', 'reportlab']
-    
-    for dep in dependencies:
-        try:
-            __import__(dep)
-        except ImportError:
-            return False
-    
-    return True
+    """Check if all dependencies are available.
+
+    The result is memoized: once everything imports (or fails to), later
+    calls return the cached boolean instead of re-importing. A successful
+    install_dependencies run updates the cache.
+    """
+    global _deps_ok
+    if _deps_ok is not None:
+        return _deps_ok
+
+    _deps_ok = all(
+        importlib.util.find_spec(dep) is not None
+        for dep in ('requests', 'reportlab')
+    )
+    return _deps_ok
@@ -1,327 +1,421 @@
-try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-
-from datetime import datetime
-import os
-
-
-class PDFExporter:
-    """Handles PDF export functionality for charging stations."""
-    
-    def __init__(self):
-        if not REPORTLAB_AVAILABLE:
-            raise ImportError("ReportLab library is not available. Please install it: pip install reportlab")
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom styles for the PDF."""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Title'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue
-        ))
-        
-        # Header style
-        self.styles.add(ParagraphStyle(
-            name='CustomHeading',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            spaceAfter=12,
-            spaceBefore=12,
-            textColor=colors.darkblue
-        ))
-        
-        # Station name style
-        self.styles.add(ParagraphStyle(
-            name='StationName',
-            parent=self.styles['Heading3'],
-            fontSize=12,
-            spaceAfter=6,
-            spaceBefore=6,
-            textColor=colors.darkgreen
-        ))
-        
-        # Footer style
-        self.styles.add(ParagraphStyle(
-            name='Footer',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            alignment=TA_CENTER,
-            textColor=colors.grey
-        ))
-    
-    def export_stations(self, stations, file_path):
-        """
-        Export charging stations to PDF.
-        
-        Args:
-            stations: List of station dictionaries
-            file_path: Output PDF file path
-        """
-        doc = SimpleDocTemplate(
-            file_path,
-            pagesize=A4,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=18
-        )
-        
-        # Build the story (content)
-        story = []
-        
-        # Title page
-        story.extend(self._create_title_page(len(stations)))
-        
-        # Summary table
-        if stations:
-            story.extend(self._create_summary_table(stations))
-        
-        # Detailed station information
-        for i, station in enumerate(stations):
-            if i > 0:  # Add page break between stations (except first)
-                story.append(PageBreak())
-            story.extend(self._create_station_detail(station, i + 1))
-        
-        # Build PDF
-        doc.build(story)
-    
-    def _create_title_page(self, station_count):
-        """Create the title page."""
-        story = []
-        
-        # Title
-        title = Paragraph(
-            "Electric Vehicle Charging Stations Report",
-            self.styles['CustomTitle']
-        )
-        story.append(title)
-        story.append(Spacer(1, 20))
-        
-        # Generation info
-        gen_info = [
-            f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}",
-            f"Total Stations: {station_count}",
-            "Data source: OpenChargeMap.org"
-        ]
-        
-        for info in gen_info:
-            p = Paragraph(info, self.styles['Normal'])
-            story.append(p)
-            story.append(Spacer(1, 12))
-        
-        story.append(Spacer(1, 40))
-        
-        # Description
-        description = """
-        This report contains detailed information about electric vehicle charging stations 
-        found in your selected area. Each station entry includes location details, 
-        operator information, connection types, and availability status.
-        """
-        
-        desc_para = Paragraph(description, self.styles['Normal'])
-        story.append(desc_para)
-        story.append(PageBreak())
-        
-        return story
-    
-    def _create_summary_table(self, stations):
-        """Create a summary table of all stations."""
-        story = []
-        
-        # Section header
-        header = Paragraph("Summary of Charging Stations", self.styles['CustomHeading'])
-        story.append(header)
-        story.append(Spacer(1, 12))
-        
-        # Prepare table data
-        table_data = [
-            ['#', 'Station Name', 'Distance (km)', 'Operator', 'Status', 'Connections']
-        ]
-        
-        for i, station in enumerate(stations, 1):
-            row = [
-                str(i),
-                station.get('name', 'Unknown')[:30] + ('...' if len(station.get('name', '')) > 30 else ''),
-                f"{station.get('distance', 'N/A'):.1f}" if station.get('distance') else 'N/A',
-                station.get('operator', 'Unknown')[:20] + ('...' if len(station.get('operator', '')) > 20 else ''),
-                station.get('status', 'Unknown'),
-                str(station.get('num_points', 0))
-            ]
-            table_data.append(row)
-        
-        # Create table
-        table = Table(table_data, colWidths=[0.5*inch, 2.5*inch, 1*inch, 1.5*inch, 1*inch, 1*inch])
-        
-        # Style the table
-        table.setStyle(TableStyle([
-            # Header row
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            
-            # Data rows
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ALTERNATEBACKGROUND', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
-        
-        story.append(table)
-        story.append(PageBreak())
-        
-        return story
-    
-    def _create_station_detail(self, station, station_num):
-        """Create detailed information for a single station."""
-        story = []
-        
-        # Station header
-        station_title = f"Station {station_num}: {station.get('name', 'Unknown Station')}"
-        title_para = Paragraph(station_title, self.styles['StationName'])
-        story.append(title_para)
-        story.append(Spacer(1, 12))
-        
-        # Basic information
-        basic_info = [
-            ('Location', station.get('address', 'Unknown')),
-            ('Coordinates', f"{station.get('latitude', 'N/A')}, {station.get('longitude', 'N/A')}"),
-            ('Distance', f"{station.get('distance', 'N/A'):.2f} km" if station.get('distance') else 'N/A'),
-            ('Operator', station.get('operator', 'Unknown')),
-            ('Status', station.get('status', 'Unknown')),
-            ('Access Type', station.get('access_type', 'Unknown')),
-            ('Number of Charging Points', str(station.get('num_points', 0))),
-        ]
-        
-        # Create basic info table
-        basic_table_data = []
-        for label, value in basic_info:
-            basic_table_data.append([f"{label}:", value])
-        
-        basic_table = Table(basic_table_data, colWidths=[2*inch, 4*inch])
-        basic_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-        ]))
-        
-        story.append(basic_table)
-        story.append(Spacer(1, 20))
-        
-        # Connection information
-        connections = station.get('connections', [])
-        if connections:
-            conn_header = Paragraph("Connection Details", self.styles['CustomHeading'])
-            story.append(conn_header)
-            story.append(Spacer(1, 8))
-            
-            conn_table_data = [
-                ['Type', 'Level', 'Power (kW)', 'Current', 'Quantity', 'Status']
-            ]
-            
-            for conn in connections:
-                row = [
-                    conn.get('type', 'Unknown'),
-                    conn.get('level', 'Unknown'),
-                    str(conn.get('power_kw', 'N/A')),
-                    conn.get('current_type', 'Unknown'),
-                    str(conn.get('quantity', 1)),
-                    conn.get('status', 'Unknown')
-                ]
-                conn_table_data.append(row)
-            
-            conn_table = Table(conn_table_data, colWidths=[1.5*inch, 1*inch, 1*inch, 1*inch, 0.8*inch, 1.2*inch])
-            conn_table.setStyle(TableStyle([
-                # Header
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                
-                # Data
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-                ('ALTERNATEBACKGROUND', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-            ]))
-            
-            story.append(conn_table)
-            story.append(Spacer(1, 20))
-        
-        # Contact information
-        contact_info = []
-        if station.get('phone'):
-            contact_info.append(('Phone', station.get('phone')))
-        if station.get('email'):
-            contact_info.append(('Email', station.get('email')))
-        if station.get('url'):
-            contact_info.append(('Website', station.get('url')))
-        
-        if contact_info:
-            contact_header = Paragraph("Contact Information", self.styles['CustomHeading'])
-            story.append(contact_header)
-            story.append(Spacer(1, 8))
-            
-            contact_table_data = []
-            for label, value in contact_info:
-                contact_table_data.append([f"{label}:", value])
-            
-            contact_table = Table(contact_table_data, colWidths=[1.5*inch, 4.5*inch])
-            contact_table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-                ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ]))
-            
-            story.append(contact_table)
-            story.append(Spacer(1, 20))
-        
-        # Additional information
-        additional_info = []
-        if station.get('cost') and station.get('cost') != 'Unknown':
-            additional_info.append(('Cost', station.get('cost')))
-        if station.get('comments'):
-            additional_info.append(('Comments', station.get('comments')))
-        if station.get('date_created'):
-            additional_info.append(('Date Created', station.get('date_created')))
-        if station.get('date_last_verified'):
-            additional_info.append(('Last Verified', station.get('date_last_verified')))
-        
-        if additional_info:
-            additional_header = Paragraph("Additional Information", self.styles['CustomHeading'])
-            story.append(additional_header)
-            story.append(Spacer(1, 8))
-            
-            for label, value in additional_info:
-                info_text = f"<b>{label}:</b> {value}"
-                info_para = Paragraph(info_text, self.styles['Normal'])
-                story.append(info_para)
-                story.append(Spacer(1, 6))
-        
-        return story
-
+from datetime import datetime
+from operator import itemgetter
+import os
+
+# reportlab pulls in a large tree of submodules, so the import is
+# deferred until a PDFExporter is actually constructed. None means
+# "not attempted yet"; _ensure_reportlab() sets True/False.
+REPORTLAB_AVAILABLE = None
+
+
+def _ensure_reportlab():
+    """Import reportlab on first use, publishing its names at module scope.
+
+    Returns True when reportlab is importable, False otherwise. The shared
+    table styles are built here too, since they need the imported classes.
+    """
+    global REPORTLAB_AVAILABLE
+    if REPORTLAB_AVAILABLE is not None:
+        return REPORTLAB_AVAILABLE
+
+    try:
+        from reportlab.lib.pagesizes import letter, A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.lib import colors
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+    except ImportError:
+        REPORTLAB_AVAILABLE = False
+        return False
+
+    globals().update(
+        letter=letter, A4=A4,
+        getSampleStyleSheet=getSampleStyleSheet, ParagraphStyle=ParagraphStyle,
+        inch=inch, colors=colors,
+        SimpleDocTemplate=SimpleDocTemplate, Paragraph=Paragraph,
+        Spacer=Spacer, Table=Table, TableStyle=TableStyle,
+        PageBreak=PageBreak,
+        TA_CENTER=TA_CENTER, TA_LEFT=TA_LEFT, TA_RIGHT=TA_RIGHT,
+    )
+    _build_table_styles()
+    REPORTLAB_AVAILABLE = True
+    return True
+
+# Every key the renderers read, with its display default; normalizing each
+# station against this once replaces the scattered per-field .get(...) calls
+_DEFAULTS = {
+    'name': 'Unknown Station',
+    'address': 'Unknown',
+    'latitude': 'N/A',
+    'longitude': 'N/A',
+    'distance': None,
+    'operator': 'Unknown',
+    'status': 'Unknown',
+    'access_type': 'Unknown',
+    'num_points': 0,
+    'connections': (),
+    'phone': None,
+    'email': None,
+    'url': None,
+    'cost': None,
+    'comments': None,
+    'date_created': None,
+    'date_last_verified': None,
+}
+
+
+# Connection rows are normalized the same way, then extracted with one
+# C-level itemgetter call instead of six .get()s per connection
+_CONN_DEFAULTS = {
+    'type': 'Unknown',
+    'level': 'Unknown',
+    'power_kw': 'N/A',
+    'current_type': 'Unknown',
+    'quantity': 1,
+    'status': 'Unknown',
+}
+
+_CONN_GETTER = itemgetter('type', 'level', 'power_kw',
+                          'current_type', 'quantity', 'status')
+
+
+def _normalize_station(station):
+    """Return a copy of *station* with every rendered key populated."""
+    st = {**_DEFAULTS, **station}
+    # Keys present but empty still need their display default
+    if not st['name']:
+        st['name'] = 'Unknown Station'
+    if not st['operator']:
+        st['operator'] = 'Unknown'
+    return st
+
+
+def _build_table_styles():
+    # Table styles are immutable once built, so one instance of each is
+    # shared across every export instead of rebuilt per station
+    global _SUMMARY_TABLE_STYLE, _BASIC_TABLE_STYLE
+    global _CONN_TABLE_STYLE, _CONTACT_TABLE_STYLE
+
+    # Each colors attribute goes through the library's module lookup;
+    # bind the handful used below once
+    darkblue = colors.darkblue
+    whitesmoke = colors.whitesmoke
+    lightgrey = colors.lightgrey
+    grey = colors.grey
+    black = colors.black
+    darkgreen = colors.darkgreen
+    white = colors.white
+
+    _SUMMARY_TABLE_STYLE = TableStyle([
+        # Header row
+        ('BACKGROUND', (0, 0), (-1, 0), darkblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+
+        # Data rows
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 1, black),
+        ('ALTERNATEBACKGROUND', (0, 1), (-1, -1), [white, lightgrey]),
+    ])
+
+    _BASIC_TABLE_STYLE = TableStyle([
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('GRID', (0, 0), (-1, -1), 0.5, grey),
+        ('BACKGROUND', (0, 0), (0, -1), lightgrey),
+    ])
+
+    _CONN_TABLE_STYLE = TableStyle([
+        # Header
+        ('BACKGROUND', (0, 0), (-1, 0), darkgreen),
+        ('TEXTCOLOR', (0, 0), (-1, 0), whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+
+        # Data
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('GRID', (0, 0), (-1, -1), 0.5, black),
+        ('ALTERNATEBACKGROUND', (0, 1), (-1, -1), [white, lightgrey]),
+    ])
+
+    _CONTACT_TABLE_STYLE = TableStyle([
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+        ('GRID', (0, 0), (-1, -1), 0.5, grey),
+        ('BACKGROUND', (0, 0), (0, -1), lightgrey),
+    ])
+
+
+class PDFExporter:
+    """Handles PDF export functionality for charging stations."""
+
+    # Stylesheet shared by all exporters; built once on first use
+    _styles_cache = None
+
+    def __init__(self):
+        if not _ensure_reportlab():
+            raise ImportError("ReportLab library is not available. Please install it: pip install reportlab")
+        self.styles = self._get_styles()
+
+    @classmethod
+    def _get_styles(cls):
+        """Return the shared stylesheet, building it on first call."""
+        styles = cls._styles_cache
+        if styles is not None:
+            return styles
+        styles = getSampleStyleSheet()
+        # Title style
+        styles.add(ParagraphStyle(
+            name='CustomTitle',
+            parent=styles['Title'],
+            fontSize=24,
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            textColor=colors.darkblue
+        ))
+        
+        # Header style
+        styles.add(ParagraphStyle(
+            name='CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=14,
+            spaceAfter=12,
+            spaceBefore=12,
+            textColor=colors.darkblue
+        ))
+        
+        # Station name style
+        styles.add(ParagraphStyle(
+            name='StationName',
+            parent=styles['Heading3'],
+            fontSize=12,
+            spaceAfter=6,
+            spaceBefore=6,
+            textColor=colors.darkgreen
+        ))
+        
+        # Footer style
+        styles.add(ParagraphStyle(
+            name='Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            alignment=TA_CENTER,
+            textColor=colors.grey
+        ))
+
+        cls._styles_cache = styles
+        return styles
+
+    def export_stations(self, stations, file_path):
+        """
+        Export charging stations to PDF.
+        
+        Args:
+            stations: List of station dictionaries
+            file_path: Output PDF file path
+        """
+        doc = SimpleDocTemplate(
+            file_path,
+            pagesize=A4,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=18
+        )
+        
+        # Normalize once so the renderers can index fields directly
+        stations = [_normalize_station(s) for s in stations]
+
+        # The section builders are generators; flowables are only
+        # materialized once, in the list doc.build requires
+        doc.build(list(self._generate_story(stations)))
+
+    def _generate_story(self, stations):
+        """Yield every flowable of the report in document order."""
+        # Title page
+        yield from self._create_title_page(len(stations))
+
+        # Summary table
+        if stations:
+            yield from self._create_summary_table(stations)
+
+        # Detailed station information
+        for i, station in enumerate(stations):
+            if i > 0:  # Add page break between stations (except first)
+                yield PageBreak()
+            yield from self._create_station_detail(station, i + 1)
+    
+    def _create_title_page(self, station_count):
+        """Yield the title page flowables."""
+        # Title
+        yield Paragraph(
+            "Electric Vehicle Charging Stations Report",
+            self.styles['CustomTitle']
+        )
+        yield Spacer(1, 20)
+
+        # Generation info as one flowable; <br/> keeps the line breaks
+        # Paragraph would otherwise collapse
+        gen_info = (
+            f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}<br/>"
+            f"Total Stations: {station_count}<br/>"
+            "Data source: OpenChargeMap.org"
+        )
+        yield Paragraph(gen_info, self.styles['Normal'])
+        yield Spacer(1, 40)
+
+        # Description
+        description = """
+        This report contains detailed information about electric vehicle charging stations
+        found in your selected area. Each station entry includes location details,
+        operator information, connection types, and availability status.
+        """
+
+        yield Paragraph(description, self.styles['Normal'])
+        yield PageBreak()
+
+    def _create_summary_table(self, stations):
+        """Yield the summary table flowables."""
+        # Section header
+        yield Paragraph("Summary of Charging Stations", self.styles['CustomHeading'])
+        yield Spacer(1, 12)
+
+        # Prepare table data
+        table_data = [
+            ['#', 'Station Name', 'Distance (km)', 'Operator', 'Status', 'Connections']
+        ]
+        
+        def trunc(s, n):
+            return s if len(s) <= n else s[:n] + '...'
+
+        def summary_rows():
+            for i, station in enumerate(stations, 1):
+                dist = station['distance']
+                yield [
+                    str(i),
+                    trunc(station['name'], 30),
+                    f"{dist:.1f}" if isinstance(dist, (int, float)) else 'N/A',
+                    trunc(station['operator'], 20),
+                    station['status'],
+                    str(station['num_points'])
+                ]
+
+        table_data.extend(summary_rows())
+        
+        # Create table
+        table = Table(table_data, colWidths=[0.5*inch, 2.5*inch, 1*inch, 1.5*inch, 1*inch, 1*inch])
+        
+        # Style the table
+        table.setStyle(_SUMMARY_TABLE_STYLE)
+
+        yield table
+        yield PageBreak()
+
+    def _create_station_detail(self, station, station_num):
+        """Yield the detail flowables for a single station."""
+        # Station header
+        station_title = f"Station {station_num}: {station['name']}"
+        yield Paragraph(station_title, self.styles['StationName'])
+        yield Spacer(1, 12)
+
+        # Basic information
+        distance = station['distance']
+        basic_info = [
+            ('Location', station['address']),
+            ('Coordinates', f"{station['latitude']}, {station['longitude']}"),
+            ('Distance', f"{distance:.2f} km" if isinstance(distance, (int, float)) else 'N/A'),
+            ('Operator', station['operator']),
+            ('Status', station['status']),
+            ('Access Type', station['access_type']),
+            ('Number of Charging Points', str(station['num_points'])),
+        ]
+        
+        # Create basic info table
+        basic_table_data = [[f"{label}:", value] for label, value in basic_info]
+
+        basic_table = Table(basic_table_data, colWidths=[2*inch, 4*inch])
+        basic_table.setStyle(_BASIC_TABLE_STYLE)
+        
+        yield basic_table
+        yield Spacer(1, 20)
+        
+        # Connection information
+        connections = station['connections']
+        if connections:
+            conn_header = Paragraph("Connection Details", self.styles['CustomHeading'])
+            yield conn_header
+            yield Spacer(1, 8)
+            
+            conn_table_data = [
+                ['Type', 'Level', 'Power (kW)', 'Current', 'Quantity', 'Status']
+            ]
+            conn_table_data.extend(
+                [str(x) for x in _CONN_GETTER({**_CONN_DEFAULTS, **conn})]
+                for conn in connections
+            )
+            
+            conn_table = Table(conn_table_data, colWidths=[1.5*inch, 1*inch, 1*inch, 1*inch, 0.8*inch, 1.2*inch])
+            conn_table.setStyle(_CONN_TABLE_STYLE)
+            
+            yield conn_table
+            yield Spacer(1, 20)
+        
+        # Contact information
+        contact_info = []
+        if station['phone']:
+            contact_info.append(('Phone', station['phone']))
+        if station['email']:
+            contact_info.append(('Email', station['email']))
+        if station['url']:
+            contact_info.append(('Website', station['url']))
+        
+        if contact_info:
+            contact_header = Paragraph("Contact Information", self.styles['CustomHeading'])
+            yield contact_header
+            yield Spacer(1, 8)
+            
+            contact_table_data = [[f"{label}:", value]
+                                  for label, value in contact_info]
+
+            contact_table = Table(contact_table_data, colWidths=[1.5*inch, 4.5*inch])
+            contact_table.setStyle(_CONTACT_TABLE_STYLE)
+            
+            yield contact_table
+            yield Spacer(1, 20)
+        
+        # Additional information
+        additional_info = []
+        if station['cost'] and station['cost'] != 'Unknown':
+            additional_info.append(('Cost', station['cost']))
+        if station['comments']:
+            additional_info.append(('Comments', station['comments']))
+        if station['date_created']:
+            additional_info.append(('Date Created', station['date_created']))
+        if station['date_last_verified']:
+            additional_info.append(('Last Verified', station['date_last_verified']))
+        
+        if additional_info:
+            additional_header = Paragraph("Additional Information", self.styles['CustomHeading'])
+            yield additional_header
+            yield Spacer(1, 8)
+            
+            # Bind the constructors locally for the per-field loop
+            _P, _Sp, normal = Paragraph, Spacer, self.styles['Normal']
+            for label, value in additional_info:
+                yield _P(f"<b>{label}:</b> {value}", normal)
+                yield _Sp(1, 6)
+        
+